@@ -16,6 +16,7 @@ import subprocess  # For launching applications
 import os  # For file path operations
 import concurrent.futures  # For parallel web searches
 import time  # For timeout tracking
+import functools  # For memoizing small lookups
 import wikipedia
 
 # Import NAV predictor modules for stock and mutual fund analysis
@@ -136,6 +137,19 @@ def get_time_greeting():
     else:
         current_hour = datetime.now().hour
     
+    return greeting_for_hour(current_hour)
+
+@functools.lru_cache(maxsize=24)
+def greeting_for_hour(current_hour):
+    """
+    Return the greeting for an hour of the day, memoized per hour
+    
+    Args:
+        current_hour (int): Hour of the day (0-23)
+        
+    Returns:
+        str: Time-appropriate greeting
+    """
     if 5 <= current_hour < 12:
         return "Good morning!"
     elif 12 <= current_hour < 17:
@@ -456,7 +456,7 @@ class StockAnalyzer:
                 }
                 
                 # Get similar stock recommendations
-                similar_stocks = get_similar_stock_recommendations(symbol, exchange, 5, include_both_exchanges=True)
+                similar_stocks = get_similar_stock_recommendations(symbol, exchange, 5)
                 analysis["similar_stock_recommendations"] = similar_stocks
             
             return analysis
@@ -502,7 +502,7 @@ class StockAnalyzer:
             
             # Ensure we have similar stock recommendations from both exchanges
             if "similar_stock_recommendations" not in analysis:
-                similar_stocks = get_similar_stock_recommendations(symbol, detected_exchange, 5, include_both_exchanges=True)
+                similar_stocks = get_similar_stock_recommendations(symbol, detected_exchange, 5)
                 analysis["similar_stock_recommendations"] = similar_stocks
             
             # Add stock info to analysis
@@ -8,10 +8,22 @@ import pandas as pd
 import numpy as np
 import json
 import re
+import os
 import logging
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 import random
+import bisect
+import concurrent.futures
+import threading
+import ijson
+from cachetools.func import ttl_cache
+
+# diskcache is optional - without it NAV data is simply fetched every time
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -30,9 +42,98 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
+# On-disk cache for NAV histories and their analyses. Published NAVs don't
+# change, so entries are keyed by today's date and expire after a day.
+NAV_CACHE_DIR = os.path.join("cache", "nav")
+NAV_CACHE_TTL = 86400
+_nav_cache = None
+_nav_cache_ready = False
+_nav_cache_lock = threading.Lock()
+
+def _get_nav_cache():
+    """
+    Open the NAV disk cache on first use.
+    
+    Returns:
+        diskcache.Cache: The cache, or None if it can't be opened - callers
+        then run uncached
+    """
+    global _nav_cache, _nav_cache_ready
+    if not _nav_cache_ready:
+        with _nav_cache_lock:
+            if not _nav_cache_ready:
+                if diskcache is not None:
+                    try:
+                        _nav_cache = diskcache.Cache(NAV_CACHE_DIR)
+                    except Exception as e:
+                        logger.warning(f"NAV cache unavailable, continuing without it: {str(e)}")
+                _nav_cache_ready = True
+    return _nav_cache
+
+def _nav_cache_get(key):
+    """Look up a NAV cache entry, treating any cache failure as a miss."""
+    cache = _get_nav_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"NAV cache read failed: {str(e)}")
+        return None
+
+def _nav_cache_set(key, value):
+    """Store a NAV cache entry for a day, ignoring any cache failure."""
+    cache = _get_nav_cache()
+    if cache is None:
+        return
+    try:
+        cache.set(key, value, expire=NAV_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"NAV cache write failed: {str(e)}")
+
+# Trend decision table shared by the stock and mutual fund analyzers.
+# bisect_left over these boundaries maps a period change (%) to an index into
+# the label tables: <= -5, <= -2, <= 2, <= 5, > 5.
+_TREND_BUCKETS = (-5, -2, 2, 5)
+
+_STOCK_LABELS = (
+    ("Strong Downward", "Consider cutting losses if short-term investor. For long-term, potential buying opportunity if fundamentals are strong."),
+    ("Downward", "Hold if long-term investor. For short-term, consider reducing position."),
+    ("Sideways", "Hold if already invested. For new investors, consider dollar-cost averaging."),
+    ("Upward", "Hold if already invested. For new investors, consider partial position."),
+    ("Strong Upward", "Consider taking profits if already invested. For new investors, wait for a pullback."),
+)
+
+_FUND_LABELS = (
+    ("Strong Downward", "Evaluate fund manager's strategy and performance. Consider researching alternatives while continuing SIP for cost averaging."),
+    ("Downward", "Continue SIP for dollar-cost averaging. Review fund fundamentals."),
+    ("Sideways", "Hold SIP investments. Monitor performance in coming weeks."),
+    ("Upward", "Continue SIP investments. Fund showing positive momentum."),
+    ("Strong Upward", "Consider continuing SIP. Good performance metrics."),
+)
+
+# Fallback recommendations when sector/industry searches come up short
+POPULAR_NSE_STOCKS = (
+    {"symbol": "RELIANCE", "name": "Reliance Industries", "exchange": "NSE"},
+    {"symbol": "TCS", "name": "Tata Consultancy Services", "exchange": "NSE"},
+    {"symbol": "HDFC", "name": "HDFC Bank", "exchange": "NSE"},
+    {"symbol": "INFY", "name": "Infosys", "exchange": "NSE"},
+    {"symbol": "ITC", "name": "ITC Limited", "exchange": "NSE"},
+    {"symbol": "SBIN", "name": "State Bank of India", "exchange": "NSE"},
+    {"symbol": "WIPRO", "name": "Wipro", "exchange": "NSE"},
+    {"symbol": "ADANIENT", "name": "Adani Enterprises", "exchange": "NSE"},
+    {"symbol": "TATAMOTORS", "name": "Tata Motors", "exchange": "NSE"},
+    {"symbol": "AXISBANK", "name": "Axis Bank", "exchange": "NSE"},
+)
+
+def _classify_trend(period_change_pct, labels):
+    """Return the (trend, recommendation) pair for a period change percentage."""
+    return labels[bisect.bisect_left(_TREND_BUCKETS, period_change_pct)]
+
 def fetch_mutual_fund_data(fund_code):
     """
     Fetch mutual fund NAV data using the MFAPI.
+    Successful responses are cached on disk for the rest of the day.
     
     Args:
         fund_code (str): The mutual fund code
@@ -40,10 +141,16 @@ def fetch_mutual_fund_data(fund_code):
     Returns:
         dict: Fund data including historical NAVs or error message
     """
+    cache_key = ("nav", str(fund_code), date.today().isoformat())
     try:
+        cached = _nav_cache_get(cache_key)
+        if cached is not None:
+            return cached
+            
         response = requests.get(f"{MUTUAL_FUND_API}{fund_code}", timeout=10)
         if response.status_code == 200:
             data = response.json()
+            _nav_cache_set(cache_key, data)
             return data
         else:
             logger.error(f"Failed to fetch mutual fund data: {response.status_code}")
@@ -64,19 +171,26 @@ def search_mutual_fund(query):
     """
     try:
         # The MFAPI doesn't provide a search endpoint, so we'll use a workaround
-        # This endpoint returns a JSON file with all mutual funds
-        response = requests.get("https://api.mfapi.in/mf", timeout=10)
-        if response.status_code == 200:
-            all_funds = response.json()
-            # Filter funds that match the query
-            matching_funds = [fund for fund in all_funds 
-                              if query.lower() in fund.get('schemeName', '').lower()]
+        # This endpoint returns a JSON file with all mutual funds, which we
+        # stream-parse so the full ~25k-entry list is never held in memory
+        query_lower = query.lower()
+        with requests.get("https://api.mfapi.in/mf", timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to search mutual funds: {response.status_code}")
+                return []
+                
+            # Let urllib3 undo any gzip/deflate encoding on the raw stream
+            response.raw.decode_content = True
             
-            # Return the top 5 matches
-            return matching_funds[:5]
-        else:
-            logger.error(f"Failed to search mutual funds: {response.status_code}")
-            return []
+            # Filter funds that match the query, stopping at the top 5 matches
+            matching_funds = []
+            for fund in ijson.items(response.raw, "item"):
+                if query_lower in fund.get('schemeName', '').lower():
+                    matching_funds.append(fund)
+                    if len(matching_funds) == 5:
+                        break
+                        
+            return matching_funds
     except Exception as e:
         logger.error(f"Error searching mutual funds: {str(e)}")
         return []
@@ -136,6 +250,10 @@ def search_stock(query, exchange="NSE"):
     """
     Search for stocks matching the given query.
     
+    Results are cached for 10 minutes per (query, exchange), so repeated
+    lookups from the recommendation path don't hit Yahoo again. Failed
+    lookups are not cached.
+    
     Args:
         query (str): Search query for stock
         exchange (str): Stock exchange (NSE or BSE) for preferential matching
@@ -144,54 +262,59 @@ def search_stock(query, exchange="NSE"):
         list: List of matching stocks with exchange information
     """
     try:
-        # Using Yahoo Finance for search
-        url = f"https://query1.finance.yahoo.com/v1/finance/search"
-        params = {
-            "q": query,
-            "quotesCount": 15,  # Increased to get more potential matches
-            "newsCount": 0
-        }
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            quotes = data.get("quotes", [])
-            
-            # Get both NSE and BSE stocks
-            nse_quotes = [q for q in quotes if q.get("exchange") == "NSI" or ".NS" in q.get("symbol", "")]
-            bse_quotes = [q for q in quotes if q.get("exchange") == "BSE" or ".BO" in q.get("symbol", "")]
-            
-            # Add exchange information
-            for q in nse_quotes:
-                q["detected_exchange"] = "NSE"
-                
-            for q in bse_quotes:
-                q["detected_exchange"] = "BSE"
-                
-            # If the requested exchange is NSE, prioritize NSE stocks
-            if exchange.upper() == "NSE":
-                filtered_quotes = nse_quotes
-                # If no NSE stocks found, return BSE stocks
-                if not filtered_quotes:
-                    filtered_quotes = bse_quotes
-            # If the requested exchange is BSE, prioritize BSE stocks
-            elif exchange.upper() == "BSE":
-                filtered_quotes = bse_quotes
-                # If no BSE stocks found, return NSE stocks
-                if not filtered_quotes:
-                    filtered_quotes = nse_quotes
-            else:
-                # If no specific exchange, combine NSE and BSE stocks
-                filtered_quotes = nse_quotes + bse_quotes
-                
-            return filtered_quotes
-        else:
-            logger.error(f"Failed to search stocks: {response.status_code}")
-            return []
+        return _search_stock_cached(query, exchange)
     except Exception as e:
         logger.error(f"Error searching stocks: {str(e)}")
         return []
 
+@ttl_cache(maxsize=2048, ttl=600)
+def _search_stock_cached(query, exchange):
+    """Query Yahoo Finance search; raises on failure so errors aren't cached."""
+    # Using Yahoo Finance for search
+    url = f"https://query1.finance.yahoo.com/v1/finance/search"
+    params = {
+        "q": query,
+        "quotesCount": 15,  # Increased to get more potential matches
+        "newsCount": 0
+    }
+    response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+    
+    if response.status_code != 200:
+        raise RuntimeError(f"Failed to search stocks: {response.status_code}")
+        
+    data = response.json()
+    quotes = data.get("quotes", [])
+    
+    # Split NSE and BSE stocks in a single pass, adding exchange information
+    nse_quotes, bse_quotes = [], []
+    for q in quotes:
+        quote_symbol = q.get("symbol", "")
+        quote_exchange = q.get("exchange")
+        if quote_exchange == "NSI" or quote_symbol.endswith(".NS"):
+            q["detected_exchange"] = "NSE"
+            nse_quotes.append(q)
+        elif quote_exchange == "BSE" or quote_symbol.endswith(".BO"):
+            q["detected_exchange"] = "BSE"
+            bse_quotes.append(q)
+        
+    # If the requested exchange is NSE, prioritize NSE stocks
+    if exchange.upper() == "NSE":
+        filtered_quotes = nse_quotes
+        # If no NSE stocks found, return BSE stocks
+        if not filtered_quotes:
+            filtered_quotes = bse_quotes
+    # If the requested exchange is BSE, prioritize BSE stocks
+    elif exchange.upper() == "BSE":
+        filtered_quotes = bse_quotes
+        # If no BSE stocks found, return NSE stocks
+        if not filtered_quotes:
+            filtered_quotes = nse_quotes
+    else:
+        # If no specific exchange, combine NSE and BSE stocks
+        filtered_quotes = nse_quotes + bse_quotes
+        
+    return filtered_quotes
+
 def analyze_stock_trend(stock_data, days=30):
     """
     Analyze stock price trend over a period.
@@ -227,30 +350,30 @@ def analyze_stock_trend(stock_data, days=30):
         daily_change_pct = ((latest_price - previous_price) / previous_price) * 100
         period_change_pct = ((latest_price - start_price) / start_price) * 100
         
-        # Calculate simple moving averages
-        sma_5 = np.mean(close_prices[-5:]) if len(close_prices) >= 5 else None
-        sma_20 = np.mean(close_prices[-20:]) if len(close_prices) >= 20 else None
+        # Calculate simple moving averages from one cumulative-sum pass over
+        # the trailing window, so each window costs O(1) after the prefix sum.
+        # Yahoo reports missing closes as None (NaN here); they are summed as
+        # zero and counted separately, so a window with a gap has no average
+        # and gaps outside the windows don't matter.
+        prices = np.asarray(close_prices[-20:], dtype=np.float64)
+        valid = ~np.isnan(prices)
+        csum = np.concatenate(([0.0], np.cumsum(np.where(valid, prices, 0.0))))
+        ccount = np.concatenate(([0], np.cumsum(valid)))
+
+        def sma(k):
+            if len(prices) < k or ccount[-1] - ccount[-1 - k] < k:
+                return None
+            return float((csum[-1] - csum[-1 - k]) / k)
+
+        sma_5 = sma(5)
+        sma_20 = sma(20)
         
         # Determine trend
-        if period_change_pct > 5:
-            trend = "Strong Upward"
-            recommendation = "Consider taking profits if already invested. For new investors, wait for a pullback."
-        elif period_change_pct > 2:
-            trend = "Upward"
-            recommendation = "Hold if already invested. For new investors, consider partial position."
-        elif period_change_pct > -2:
-            trend = "Sideways"
-            recommendation = "Hold if already invested. For new investors, consider dollar-cost averaging."
-        elif period_change_pct > -5:
-            trend = "Downward"
-            recommendation = "Hold if long-term investor. For short-term, consider reducing position."
-        else:
-            trend = "Strong Downward"
-            recommendation = "Consider cutting losses if short-term investor. For long-term, potential buying opportunity if fundamentals are strong."
+        trend, recommendation = _classify_trend(period_change_pct, _STOCK_LABELS)
 
         # Compare with moving averages
-        price_vs_sma5 = "above" if latest_price > sma_5 else "below" if sma_5 else "unknown"
-        price_vs_sma20 = "above" if latest_price > sma_20 else "below" if sma_20 else "unknown"
+        price_vs_sma5 = "unknown" if sma_5 is None else "above" if latest_price > sma_5 else "below"
+        price_vs_sma20 = "unknown" if sma_20 is None else "above" if latest_price > sma_20 else "below"
         
         # Additional recommendation based on moving averages
         if price_vs_sma5 == "above" and price_vs_sma20 == "above":
@@ -269,8 +392,8 @@ def analyze_stock_trend(stock_data, days=30):
             "latest_price": round(latest_price, 2),
             "daily_change_percentage": round(daily_change_pct, 2),
             "period_change_percentage": round(period_change_pct, 2),
-            "sma_5": round(sma_5, 2) if sma_5 else None,
-            "sma_20": round(sma_20, 2) if sma_20 else None,
+            "sma_5": round(sma_5, 2) if sma_5 is not None else None,
+            "sma_20": round(sma_20, 2) if sma_20 is not None else None,
             "trend": trend,
             "moving_average_signal": ma_signal,
             "recommendation": recommendation
@@ -294,6 +417,14 @@ def analyze_mutual_fund(fund_data, days=30):
         if "error" in fund_data:
             return fund_data
             
+        # Reuse today's analysis for this fund and window if we already have one
+        scheme_code = fund_data.get("meta", {}).get("scheme_code")
+        cache_key = ("analysis", str(scheme_code), days, date.today().isoformat())
+        if scheme_code is not None:
+            cached = _nav_cache_get(cache_key)
+            if cached is not None:
+                return cached
+                
         # Extract data
         scheme_name = fund_data.get("meta", {}).get("scheme_name", "Unknown Fund")
         fund_house = fund_data.get("meta", {}).get("fund_house", "Unknown AMC")
@@ -321,23 +452,9 @@ def analyze_mutual_fund(fund_data, days=30):
         annual_return_pct = period_change_pct * (365 / min(days, len(recent_navs)))
         
         # Determine trend and recommendation
-        if period_change_pct > 5:
-            trend = "Strong Upward"
-            recommendation = "Consider continuing SIP. Good performance metrics."
-        elif period_change_pct > 2:
-            trend = "Upward"
-            recommendation = "Continue SIP investments. Fund showing positive momentum."
-        elif period_change_pct > -2:
-            trend = "Sideways"
-            recommendation = "Hold SIP investments. Monitor performance in coming weeks."
-        elif period_change_pct > -5:
-            trend = "Downward"
-            recommendation = "Continue SIP for dollar-cost averaging. Review fund fundamentals."
-        else:
-            trend = "Strong Downward"
-            recommendation = "Evaluate fund manager's strategy and performance. Consider researching alternatives while continuing SIP for cost averaging."
+        trend, recommendation = _classify_trend(period_change_pct, _FUND_LABELS)
             
-        return {
+        analysis = {
             "status": "success",
             "scheme_name": scheme_name,
             "fund_house": fund_house,
@@ -349,11 +466,16 @@ def analyze_mutual_fund(fund_data, days=30):
             "trend": trend,
             "recommendation": recommendation
         }
+        
+        if scheme_code is not None:
+            _nav_cache_set(cache_key, analysis)
+            
+        return analysis
     except Exception as e:
         logger.error(f"Error analyzing mutual fund: {str(e)}")
         return {"error": f"Error analyzing mutual fund: {str(e)}"}
 
-def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_both_exchanges=False):
+def get_similar_stock_recommendations(symbol, exchange="NSE", count=4):
     """
     Get recommendations for similar stocks.
     
@@ -361,15 +483,11 @@ def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_b
         symbol (str): Stock symbol
         exchange (str): Stock exchange (NSE or BSE)
         count (int): Number of recommendations to return
-        include_both_exchanges (bool): Whether to include stocks from both exchanges
         
     Returns:
         list: List of recommended stocks
     """
     try:
-        # Always include both exchanges to provide more options
-        include_both_exchanges = True
-        
         # First try to find similar stocks based on sector and industry
         all_recommendations = []
         
@@ -385,11 +503,9 @@ def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_b
         
         # If we don't have sector/industry info, just search more broadly
         if not target_sector and not target_industry:
-            # Search using the symbol as a query
-            search_results = search_stock(symbol, exchange)
-            
+            # Reuse the symbol search we already ran above
             # Filter out the target stock
-            filtered_results = [s for s in search_results if s.get("symbol", "").split(".")[0] != symbol]
+            filtered_results = [s for s in stock_search if s.get("symbol", "").split(".")[0] != symbol]
             
             # Process the search results
             for stock in filtered_results[:count*2]:  # Get more than needed to allow for filtering
@@ -404,43 +520,36 @@ def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_b
             sector_results = []
             industry_results = []
             
-            # Get more stocks from the same sector
-            if target_sector:
-                sector_keywords = target_sector.split()
-                for keyword in sector_keywords:
-                    if len(keyword) > 3:  # Only use meaningful keywords
-                        sector_matches = search_stock(keyword, exchange)
-                        for match in sector_matches:
-                            # Check if it's a different stock
-                            if match.get("symbol", "").split(".")[0] != symbol:
-                                stock_info = {
-                                    "symbol": match.get("symbol", "").split(".")[0],
-                                    "name": match.get("shortname", match.get("longname", "Unknown")),
-                                    "exchange": match.get("detected_exchange", exchange),
-                                    "sector": match.get("sector", ""),
-                                    "industry": match.get("industry", "")
-                                }
-                                if stock_info not in sector_results:
-                                    sector_results.append(stock_info)
+            # Only use meaningful keywords, tagged by where they came from
+            all_keywords = (
+                [(keyword, "sector") for keyword in (target_sector or "").split() if len(keyword) > 3] +
+                [(keyword, "industry") for keyword in (target_industry or "").split() if len(keyword) > 3]
+            )
+            
+            # Run all keyword searches in parallel rather than one sweep after another
+            all_matches = []
+            if all_keywords:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(all_keywords))) as executor:
+                    all_matches = list(executor.map(lambda kw: search_stock(kw[0], exchange), all_keywords))
             
-            # Get more stocks from the same industry
-            if target_industry:
-                industry_keywords = target_industry.split()
-                for keyword in industry_keywords:
-                    if len(keyword) > 3:  # Only use meaningful keywords
-                        industry_matches = search_stock(keyword, exchange)
-                        for match in industry_matches:
-                            # Check if it's a different stock
-                            if match.get("symbol", "").split(".")[0] != symbol:
-                                stock_info = {
-                                    "symbol": match.get("symbol", "").split(".")[0],
-                                    "name": match.get("shortname", match.get("longname", "Unknown")),
-                                    "exchange": match.get("detected_exchange", exchange),
-                                    "sector": match.get("sector", ""),
-                                    "industry": match.get("industry", "")
-                                }
-                                if stock_info not in industry_results and stock_info not in sector_results:
-                                    industry_results.append(stock_info)
+            # Bucket the results by tag; sector keywords come first, so the
+            # de-duplication order matches the old sequential sweeps
+            for (_, tag), matches in zip(all_keywords, all_matches):
+                for match in matches:
+                    # Check if it's a different stock
+                    if match.get("symbol", "").split(".")[0] != symbol:
+                        stock_info = {
+                            "symbol": match.get("symbol", "").split(".")[0],
+                            "name": match.get("shortname", match.get("longname", "Unknown")),
+                            "exchange": match.get("detected_exchange", exchange),
+                            "sector": match.get("sector", ""),
+                            "industry": match.get("industry", "")
+                        }
+                        if tag == "sector":
+                            if stock_info not in sector_results:
+                                sector_results.append(stock_info)
+                        elif stock_info not in industry_results and stock_info not in sector_results:
+                            industry_results.append(stock_info)
             
             # Prioritize industry matches over sector matches
             all_recommendations = industry_results + sector_results
@@ -448,26 +557,12 @@ def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_b
         # Ensure we have enough recommendations
         if len(all_recommendations) < count:
             # If we don't have enough recommendations, add some popular stocks
-            popular_stocks = [
-                {"symbol": "RELIANCE", "name": "Reliance Industries", "exchange": "NSE"},
-                {"symbol": "TCS", "name": "Tata Consultancy Services", "exchange": "NSE"},
-                {"symbol": "HDFC", "name": "HDFC Bank", "exchange": "NSE"},
-                {"symbol": "INFY", "name": "Infosys", "exchange": "NSE"},
-                {"symbol": "ITC", "name": "ITC Limited", "exchange": "NSE"},
-                {"symbol": "SBIN", "name": "State Bank of India", "exchange": "NSE"},
-                {"symbol": "WIPRO", "name": "Wipro", "exchange": "NSE"},
-                {"symbol": "ADANIENT", "name": "Adani Enterprises", "exchange": "NSE"},
-                {"symbol": "TATAMOTORS", "name": "Tata Motors", "exchange": "NSE"},
-                {"symbol": "AXISBANK", "name": "Axis Bank", "exchange": "NSE"}
-            ]
-            
-            # Remove any popular stocks that match our target stock
-            filtered_popular = [s for s in popular_stocks if s["symbol"] != symbol]
-            
-            # Add popular stocks not already in our recommendations
-            for stock in filtered_popular:
-                if stock not in all_recommendations:
-                    all_recommendations.append(stock)
+            # Add popular stocks that aren't the target or already recommended
+            existing_symbols = {s.get("symbol", "") for s in all_recommendations}
+            all_recommendations.extend(
+                dict(stock) for stock in POPULAR_NSE_STOCKS
+                if stock["symbol"] != symbol and stock["symbol"] not in existing_symbols
+            )
         
         # Remove duplicates by symbol
         symbols_added = set()
@@ -478,39 +573,6 @@ def get_similar_stock_recommendations(symbol, exchange="NSE", count=4, include_b
                 symbols_added.add(stock_symbol)
                 unique_recommendations.append(stock)
         
-        # Get recommendations from other exchange if requested
-        if include_both_exchanges:
-            other_exchange = "BSE" if exchange.upper() == "NSE" else "NSE"
-            
-            # Convert our NSE recommendations to their BSE equivalents
-            if exchange.upper() == "NSE":
-                bse_recommendations = convert_nse_to_bse(unique_recommendations[:count])
-                
-                # Add BSE recommendations
-                for stock in bse_recommendations:
-                    if stock.get("symbol", "") and stock not in unique_recommendations:
-                        unique_recommendations.append(stock)
-            else:
-                # Try to find similar stocks on NSE
-                nse_recommendations = []
-                for stock in unique_recommendations[:count]:
-                    symbol = stock.get("symbol", "").replace(".BO", "")
-                    if symbol:
-                        nse_matches = search_stock(symbol, "NSE")
-                        if nse_matches:
-                            nse_stock = {
-                                "symbol": nse_matches[0].get("symbol", "").split(".")[0],
-                                "name": nse_matches[0].get("shortname", nse_matches[0].get("longname", "Unknown")),
-                                "exchange": "NSE"
-                            }
-                            if nse_stock not in nse_recommendations:
-                                nse_recommendations.append(nse_stock)
-                
-                # Add NSE recommendations
-                for stock in nse_recommendations:
-                    if stock.get("symbol", "") and stock not in unique_recommendations:
-                        unique_recommendations.append(stock)
-        
         # Return the top count recommendations
         return unique_recommendations[:count*2]  # Return more recommendations for variety
         
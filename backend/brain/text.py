@@ -14,12 +14,26 @@ import subprocess
 import platform
 import tempfile
 import sys
+import hashlib
+import collections
+import re
+import shutil
+from contextlib import nullcontext
+
+# pywin32 gives us direct, in-process access to SAPI on Windows
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = None
+    win32com = None
 
 # Create a separate file for logging speech messages instead of printing them
 speech_log_file = None
 try:
-    # Ensure logs directory exists
-    os.makedirs("logs", exist_ok=True)
+    # Ensure logs directory exists - a stat is cheaper than a failed mkdir
+    if not os.path.isdir("logs"):
+        os.makedirs("logs", exist_ok=True)
     speech_log_path = os.path.join("logs", "friday_speech.log")
     speech_log_file = open(speech_log_path, "a", encoding="utf-8")
     speech_log_file.write(f"\n\n--- FRIDAY SPEECH LOG STARTED AT {time.ctime()} ---\n\n")
@@ -27,25 +41,76 @@ except Exception as e:
     print(f"Warning: Could not create speech log file: {e}")
     speech_log_file = None
 
+# Speech log lines are queued and written in batches by a background thread,
+# so logging never blocks the speech worker on file I/O
+speech_log_queue = queue.SimpleQueue()
+SPEECH_LOG_FLUSH_INTERVAL = 0.1  # Seconds a line may wait before being flushed
+SPEECH_LOG_BATCH_SIZE = 64       # Flush early once this many lines are pending
+
 # Function to log speech messages without printing to console
 def log_speech(message):
     """Log speech-related messages to file instead of printing to console"""
     if speech_log_file:
+        speech_log_queue.put(f"{time.ctime()}: {message}\n")
+
+def write_speech_log(lines):
+    """Write a batch of log lines to the speech log file"""
+    try:
+        speech_log_file.write("".join(lines))
+        speech_log_file.flush()
+    except:
+        pass
+
+def speech_log_writer():
+    """Thread that drains the speech log queue, flushing at most every 100ms"""
+    pending = []
+    deadline = 0.0
+    while True:
         try:
-            speech_log_file.write(f"{time.ctime()}: {message}\n")
-            speech_log_file.flush()
-        except:
-            pass
+            if pending:
+                line = speech_log_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            else:
+                # Nothing pending - sleep until the next line arrives
+                line = speech_log_queue.get()
+        except queue.Empty:
+            line = ""
+            
+        # None is the shutdown sentinel from cleanup()
+        if line is None:
+            if pending:
+                write_speech_log(pending)
+            return
+            
+        if line:
+            if not pending:
+                deadline = time.monotonic() + SPEECH_LOG_FLUSH_INTERVAL
+            pending.append(line)
+            
+        if pending and (not line or len(pending) >= SPEECH_LOG_BATCH_SIZE or time.monotonic() >= deadline):
+            write_speech_log(pending)
+            pending.clear()
+
+speech_log_thread = None
+if speech_log_file:
+    speech_log_thread = threading.Thread(target=speech_log_writer, name="FRIDAY-SpeechLog")
+    speech_log_thread.daemon = True
+    speech_log_thread.start()
 
 # Print system information only to log file
 log_speech(f"System platform: {platform.system()}")
 log_speech(f"Python version: {platform.python_version()}")
 
-# Create a lock for thread synchronization
-speech_lock = threading.Lock()
+# The pyttsx3 engine is only ever driven by the speech worker thread, so its
+# lock is a no-op - the with-statement stays to mark the engine as worker-owned
+speech_lock = nullcontext()
+
+# The direct SAPI path runs on whatever thread calls speak_text, and those
+# threads share the TTS cache, so it needs a real lock
+sapi_lock = threading.Lock()
 
-# Create a queue for speech tasks
-speech_queue = queue.Queue()
+# Create a queue for speech tasks - SimpleQueue is a lighter C queue, and
+# nothing waits on task completion
+speech_queue = queue.SimpleQueue()
 
 # Flag to control the speech worker thread
 speech_running = True
@@ -56,8 +121,43 @@ speech_engine_working = False
 # Flag to determine which speech method to use
 use_direct_method = True  # Set to True to force using direct method
 
-# Determine the best speech method based on previous success
-best_speech_method = "simple_vbs"  # Default to simplest method that works most reliably
+# SAPI SpVoice speak flags
+SVSF_DEFAULT = 0
+SVSF_ASYNC = 1
+
+# Sentence boundaries used to stream long responses to the engine piece by piece
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# SpFileStream open modes
+SSFM_OPEN_FOR_READ = 0
+SSFM_CREATE_FOR_WRITE = 3
+
+# SAPI voices, one per calling thread - COM objects belong to the apartment of
+# the thread that created them, and speak_text can be called from any thread.
+# Voices at normal priority share the audio device in turn, so utterances
+# from different threads still play one after another.
+sapi_local = threading.local()
+
+# On-disk LRU cache of synthesized WAVs for short, frequently repeated phrases
+TTS_CACHE_DIR = os.path.join("logs", "tts_cache")
+TTS_CACHE_SIZE = 128
+TTS_CACHE_MAX_CHARS = 200  # Longer text is spoken directly so playback starts sooner
+TTS_SEEN_SIZE = 256  # Uncached phrases remembered while waiting for a repeat
+tts_cache = collections.OrderedDict()  # WAV path -> None, oldest first
+tts_seen = collections.OrderedDict()   # WAV path -> None for phrases spoken once, oldest first
+try:
+    if not os.path.isdir(TTS_CACHE_DIR):
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    # Pick up WAVs rendered by previous runs, least recently used first
+    cached_wavs = [os.path.join(TTS_CACHE_DIR, name) for name in os.listdir(TTS_CACHE_DIR) if name.endswith(".wav")]
+    for cached_wav in sorted(cached_wavs, key=os.path.getmtime):
+        tts_cache[cached_wav] = None
+except Exception as e:
+    log_speech(f"Could not load TTS cache: {e}")
+
+# OneCore voices start speaking sooner than the legacy SAPI 5 voices,
+# so they are picked first when installed
+PREFERRED_VOICE_ID_SUFFIXES = ("enUS_AriaM", "enUS_ZiraM")
 
 # Global engine - initialized once
 engine = None
@@ -68,62 +168,219 @@ try:
     
     # Get available voices and set a better voice if available
     voices = engine.getProperty('voices')
-    log_speech(f"Available voices: {len(voices)}")
-    for voice in voices:
-        log_speech(f"Voice ID: {voice.id}, Name: {voice.name}")
-        # Prefer English voice
-        if "english" in voice.name.lower():
-            engine.setProperty('voice', voice.id)
-            log_speech(f"Using voice: {voice.name}")
-            break
+    voice_list = tuple((voice.id, voice.name, voice.name.lower()) for voice in voices or ())
+    log_speech(f"Available voices ({len(voice_list)}): " + ", ".join(name for _, name, _ in voice_list))
     
-    # Test if engine works
-    try:
-        engine.say("test")
-        engine.runAndWait()
-        speech_engine_working = True
-        best_speech_method = "pyttsx3"
-        log_speech("Text-to-speech engine initialized and tested successfully")
-    except Exception as test_error:
-        log_speech(f"pyttsx3 engine failed to speak test message: {test_error}")
-        speech_engine_working = False
+    # Prefer a OneCore voice, then any English voice
+    selected_voice = next((
+        (voice_id, name) for suffix in PREFERRED_VOICE_ID_SUFFIXES
+        for voice_id, name, _ in voice_list if voice_id.endswith(suffix)
+    ), None) or next((
+        (voice_id, name) for voice_id, name, name_lower in voice_list if "english" in name_lower
+    ), None)
+    if selected_voice:
+        engine.setProperty('voice', selected_voice[0])
+        log_speech(f"Using voice: {selected_voice[1]}")
+    
+    # pyttsx3 raises on driver load failure, so a successful property read is
+    # enough to know the engine is live - no need to speak a test phrase aloud
+    speech_engine_working = voices is not None
+    if speech_engine_working:
+        log_speech("Text-to-speech engine initialized successfully")
+    else:
+        log_speech("pyttsx3 engine reported no voices")
 except Exception as e:
     log_speech(f"Error initializing speech engine: {e}")
     engine = None
 
+# Prefer direct SAPI calls when pywin32 is available - no script files or
+# child processes per utterance. speak_text then hands text straight to SAPI's
+# own async queue and the Python speech worker is only started as a fallback.
+use_direct_sapi = platform.system() == "Windows" and win32com is not None
+
+def get_sapi_voice():
+    """
+    Get this thread's SAPI voice, creating it on first use
+    
+    Returns:
+        SpVoice: A voice owned by the calling thread's COM apartment
+    """
+    voice = getattr(sapi_local, "voice", None)
+    if voice is None:
+        pythoncom.CoInitialize()
+        voice = win32com.client.Dispatch("SAPI.SpVoice")
+        sapi_local.voice = voice
+    return voice
+
+def get_tts_cache_path(text):
+    """Return the cache file path for a phrase's synthesized WAV"""
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{key}.wav")
+
+def touch_tts_cache(path):
+    """Mark a cached WAV as recently used, evicting the oldest over capacity"""
+    tts_cache[path] = None
+    tts_cache.move_to_end(path)
+    while len(tts_cache) > TTS_CACHE_SIZE:
+        old_path, _ = tts_cache.popitem(last=False)
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+
+def render_sapi_wav(voice, text, path):
+    """Synthesize text into a WAV file with SAPI instead of the speakers"""
+    temp_path = f"{path}.tmp"
+    stream = win32com.client.Dispatch("SAPI.SpFileStream")
+    stream.Open(temp_path, SSFM_CREATE_FOR_WRITE)
+    original_output = voice.AudioOutputStream
+    try:
+        voice.AudioOutputStream = stream
+        voice.Speak(text, SVSF_DEFAULT)
+    finally:
+        stream.Close()
+        voice.AudioOutputStream = original_output
+    # Only publish complete files to the cache
+    os.replace(temp_path, path)
+
+# Phrases are rendered into the cache by a background thread, so a cache miss
+# never delays speech - started on first use
+tts_render_queue = queue.SimpleQueue()
+tts_render_thread = None
+
+def tts_render_worker():
+    """Thread that renders repeated phrases into the WAV cache"""
+    while True:
+        text, path = tts_render_queue.get()
+        try:
+            with sapi_lock:
+                if path in tts_cache:
+                    continue
+            # Rendering uses this thread's own voice, so it doesn't need the lock
+            render_sapi_wav(get_sapi_voice(), text, path)
+            with sapi_lock:
+                touch_tts_cache(path)
+        except Exception as e:
+            log_speech(f"TTS cache render error: {e}")
+
+def queue_tts_render(text, path):
+    """Hand a phrase to the render thread, starting it if needed (call with sapi_lock held)"""
+    global tts_render_thread
+    if tts_render_thread is None:
+        tts_render_thread = threading.Thread(target=tts_render_worker, name="FRIDAY-TTSRender")
+        tts_render_thread.daemon = True
+        tts_render_thread.start()
+    tts_render_queue.put((text, path))
+
+def note_tts_miss(text, path):
+    """
+    Record an uncached phrase, queueing it for rendering once it has been
+    spoken twice so one-off responses never reach the disk (call with sapi_lock held)
+    """
+    if path in tts_seen:
+        del tts_seen[path]
+        queue_tts_render(text, path)
+    else:
+        tts_seen[path] = None
+        while len(tts_seen) > TTS_SEEN_SIZE:
+            tts_seen.popitem(last=False)
+
+# Direct SAPI method using pywin32 - fastest option on Windows
+def speak_with_sapi(text, wait=True):
+    """
+    Speak text through an in-process SAPI SpVoice COM object
+    
+    Args:
+        text (str): The text to speak
+        wait (bool): Block until playback finishes; False leaves the text on
+            SAPI's async queue and returns immediately
+        
+    Returns:
+        bool: True if the text was handed to SAPI
+    """
+    if not use_direct_sapi:
+        return False  # SAPI via pywin32 only works on Windows
+        
+    try:
+        with sapi_lock:
+            voice = get_sapi_voice()
+            
+            # Replay short phrases from the WAV cache instead of re-synthesizing them
+            wav_path = get_tts_cache_path(text) if len(text) <= TTS_CACHE_MAX_CHARS else None
+            if wav_path in tts_cache:
+                touch_tts_cache(wav_path)
+                
+                # The WAV goes through the voice's async queue, so it plays in
+                # order with everything else queued on it
+                stream = win32com.client.Dispatch("SAPI.SpFileStream")
+                stream.Open(wav_path, SSFM_OPEN_FOR_READ)
+                voice.SpeakStream(stream, SVSF_ASYNC)
+            elif wav_path is not None:
+                # Cache miss - speak it straight away and leave caching to the
+                # render thread, so the caller never waits on a render
+                note_tts_miss(text, wav_path)
+                voice.Speak(text, SVSF_ASYNC)
+            else:
+                # Queue the text sentence by sentence on SAPI's own async queue so
+                # audio starts after the first sentence instead of the whole text
+                for sentence in SENTENCE_SPLIT_RE.split(text):
+                    if sentence:
+                        voice.Speak(sentence, SVSF_ASYNC)
+            if wait:
+                voice.WaitUntilDone(-1)
+        return True
+    except Exception as e:
+        log_speech(f"SAPI speech error: {e}")
+        return False
+
+# Process creation flag that keeps helper processes from flashing a console window
+CREATE_NO_WINDOW = 0x08000000
+
+# Currently running speech helper process, so cleanup() can stop it on exit
+speech_process = None
+
+def run_speech_process(args):
+    """Run a speech helper process directly, without a console window or an intermediate shell"""
+    global speech_process
+    speech_process = subprocess.Popen(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=CREATE_NO_WINDOW
+    )
+    try:
+        return speech_process.wait()
+    finally:
+        speech_process = None
+
+# Temp VBS files, reused for every utterance instead of created and deleted each time
+VBS_TEMP = os.path.join(tempfile.gettempdir(), "friday_speak.vbs")
+VBS_TEMP_WSCRIPT = os.path.join(tempfile.gettempdir(), "friday_speak2.vbs")
+
+# Build the VBS source that speaks the given text
+def build_vbs_script(text):
+    """Build a VBS script that speaks text through SAPI"""
+    # Double quotes need to be doubled in VBS, and line breaks would end the string literal
+    safe_text = text.replace('"', '""').replace("\r", " ").replace("\n", " ")
+    # Remove problematic characters that could break VBS strings
+    safe_text = safe_text.encode('ascii', 'ignore').decode('ascii')
+    # SAPI handles arbitrarily long text, so a single Speak call is enough
+    return f'Set speech = CreateObject("SAPI.SpVoice")\nspeech.Speak "{safe_text}"\n'
+
 # Simple direct VBS method - most reliable and doesn't require admin rights
-def speak_with_simple_vbs(text):
+def speak_with_simple_vbs(text, script=None):
     """Use a simple VBS script to speak text without requiring admin rights"""
     if platform.system() != "Windows":
         return False  # VBS only works on Windows
         
     try:
-        # Create a temporary VBS script file in the system temp directory
-        temp_file = os.path.join(tempfile.gettempdir(), "friday_speak.vbs")
-        
-        # Handle special characters and quotes that can break VBS strings
-        # Break text into smaller chunks of 150 characters each to avoid VBS string issues
-        chunks = [text[i:i+150] for i in range(0, len(text), 150)]
-        
-        # Create VBS script with proper character handling and multiple speak commands
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write('Set speech = CreateObject("SAPI.SpVoice")\n')
-            for chunk in chunks:
-                # Double quotes need to be doubled in VBS
-                safe_chunk = chunk.replace('"', '""')
-                # Remove problematic characters that could break VBS strings
-                safe_chunk = ''.join(c for c in safe_chunk if ord(c) < 128)
-                f.write(f'speech.Speak "{safe_chunk}"\n')
+        # Overwrite the reusable temp script ("w" truncates), using the
+        # pre-built script if the worker prepared one ahead of time
+        with open(VBS_TEMP, "w", encoding="utf-8") as f:
+            f.write(script if script is not None else build_vbs_script(text))
         
-        # Add redirect to hide console output
-        os.system(f'cscript //nologo "{temp_file}" >nul 2>&1')
-        
-        # Clean up the temp file
-        try:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        except:
-            pass
+        # Run the script with cscript, discarding its console output
+        run_speech_process(["cscript", "//nologo", VBS_TEMP])
             
         return True
     except Exception as e:
@@ -131,44 +388,47 @@ def speak_with_simple_vbs(text):
         return False
 
 # Alternative direct method using wscript instead of cscript
-def speak_with_wscript(text):
+def speak_with_wscript(text, script=None):
     """Use wscript instead of cscript for silent operation"""
     if platform.system() != "Windows":
         return False  # VBS only works on Windows
         
     try:
-        # Create a temporary VBS script file in the system temp directory
-        temp_file = os.path.join(tempfile.gettempdir(), "friday_speak2.vbs")
-        
-        # Handle special characters and quotes that can break VBS strings
-        # Break text into smaller chunks to avoid VBS string issues
-        chunks = [text[i:i+150] for i in range(0, len(text), 150)]
-        
-        # Create VBS script with proper character handling and multiple speak commands
-        with open(temp_file, "w", encoding="utf-8") as f:
-            f.write('Set speech = CreateObject("SAPI.SpVoice")\n')
-            for chunk in chunks:
-                # Double quotes need to be doubled in VBS
-                safe_chunk = chunk.replace('"', '""')
-                # Remove problematic characters that could break VBS strings
-                safe_chunk = ''.join(c for c in safe_chunk if ord(c) < 128)
-                f.write(f'speech.Speak "{safe_chunk}"\n')
+        # Overwrite the reusable temp script ("w" truncates), using the
+        # pre-built script if the worker prepared one ahead of time
+        with open(VBS_TEMP_WSCRIPT, "w", encoding="utf-8") as f:
+            f.write(script if script is not None else build_vbs_script(text))
         
         # Run the script with wscript for silent operation (won't show any output)
-        os.system(f'wscript "{temp_file}" >nul 2>&1')
-        
-        # Clean up the temp file
-        try:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-        except:
-            pass
+        run_speech_process(["wscript", VBS_TEMP_WSCRIPT])
             
         return True
     except Exception as e:
         log_speech(f"Wscript speech error: {e}")
         return False
 
+# Long-lived PowerShell session that reads speak commands from stdin, so the
+# .NET runtime and System.Speech are only loaded once - started on first use
+powershell_process = None
+
+def get_powershell_process():
+    """Return the running PowerShell speech session, starting it if needed"""
+    global powershell_process
+    if powershell_process is None or powershell_process.poll() is not None:
+        powershell_process = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NoExit", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=CREATE_NO_WINDOW
+        )
+        powershell_process.stdin.write(
+            b"Add-Type -AssemblyName System.Speech; "
+            b"$s = New-Object System.Speech.Synthesis.SpeechSynthesizer\n"
+        )
+        powershell_process.stdin.flush()
+    return powershell_process
+
 # Fallback speech method using Windows PowerShell
 def speak_with_powershell(text):
     """Use Windows PowerShell to speak text (Windows only)"""
@@ -176,105 +436,195 @@ def speak_with_powershell(text):
         return False  # PowerShell only works on Windows
         
     try:
-        # Break text into smaller chunks
-        chunks = [text[i:i+150] for i in range(0, len(text), 150)]
+        # Remove problematic characters; line breaks would end the command early
+        safe_text = text.replace("\r", " ").replace("\n", " ")
+        safe_text = safe_text.encode('ascii', 'ignore').decode('ascii')
+        
+        # Single quotes are doubled inside a PowerShell single-quoted string,
+        # which also keeps backticks and $ from being interpreted
+        escaped_text = safe_text.replace("'", "''")
         
-        for chunk in chunks:
-            # Escape quotes in the text
-            escaped_text = chunk.replace('"', '\\"').replace("'", "\\'")
-            # Remove problematic characters
-            escaped_text = ''.join(c for c in escaped_text if ord(c) < 128)
-            # Run PowerShell command to speak the text
-            command = f'powershell -command "Add-Type -AssemblyName System.Speech; (New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak(\'{escaped_text}\')" >nul 2>&1'
-            os.system(command)  # Use os.system instead of subprocess
+        # The session speaks commands in the order they are written, and the
+        # synthesizer handles text of any length, so no chunking is needed
+        process = get_powershell_process()
+        process.stdin.write(f"$s.Speak('{escaped_text}')\n".encode("ascii"))
+        process.stdin.flush()
         
         return True
     except Exception as e:
         log_speech(f"PowerShell speech error: {e}")
         return False
 
+# Cross-platform speech through the pyttsx3 engine
+def speak_with_pyttsx3(text):
+    """Speak text with the shared pyttsx3 engine"""
+    if engine is None:
+        return False
+        
+    try:
+        with speech_lock:
+            log_speech(f"Speaking with pyttsx3: {text[:30]}..." if len(text) > 30 else f"Speaking with pyttsx3: {text}")
+            # Queue each sentence, then let the engine play them back to back
+            for sentence in SENTENCE_SPLIT_RE.split(text):
+                if sentence:
+                    engine.say(sentence)
+            engine.runAndWait()
+        return True
+    except Exception as e:
+        log_speech(f"pyttsx3 speech error: {e}")
+        return False
+
+def find_speech_methods():
+    """
+    Work out which speech methods can run here, without speaking anything
+    
+    Returns:
+        list: (name, speak_function) pairs in order of preference. Every
+        speak function takes (text, vbs_script) and returns True on success.
+    """
+    is_windows = platform.system() == "Windows"
+    candidates = (
+        ("sapi", use_direct_sapi, lambda text, script: speak_with_sapi(text)),
+        ("pyttsx3", engine is not None and speech_engine_working, lambda text, script: speak_with_pyttsx3(text)),
+        ("simple_vbs", is_windows and shutil.which("cscript") is not None, speak_with_simple_vbs),
+        ("wscript", is_windows and shutil.which("wscript") is not None, speak_with_wscript),
+        ("powershell", is_windows and shutil.which("powershell") is not None, lambda text, script: speak_with_powershell(text)),
+    )
+    return [(name, speak) for name, available, speak in candidates if available]
+
+# Speech methods resolved once at import - the worker always uses the first
+# one and only moves down the list when it fails
+speech_methods = find_speech_methods()
+log_speech("Speech methods: " + (", ".join(name for name, _ in speech_methods) or "none"))
+
+# Texts queued within this window of each other are spoken as one utterance
+COALESCE_WINDOW_MS = 80
+COALESCE_MAX_CHARS = 500
+
+# Prepared utterances handed from the prefetch thread to the speech worker.
+# maxsize=1 keeps exactly one utterance ready while the current one plays.
+prepared_queue = queue.Queue(maxsize=1)
+
+def fetch_next_speech():
+    """
+    Wait for the next queued text and do its prep work
+    
+    Returns:
+        tuple: (text, vbs_script) ready to speak, or None when speech is stopping
+    """
+    while True:
+        # Block until there is something to speak; cleanup() queues None to stop
+        text = speech_queue.get()
+        if text is None:
+            return None
+        
+        # Don't try to speak empty text
+        if not text or not text.strip():
+            continue
+            
+        # Coalesce texts that arrive in quick succession (e.g. streamed partial
+        # responses) into one utterance, so the engine starts up once per burst
+        parts = [text]
+        total_chars = len(text)
+        deadline = time.monotonic() + COALESCE_WINDOW_MS / 1000
+        while total_chars < COALESCE_MAX_CHARS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                more = speech_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if more is None:
+                # Leave the shutdown sentinel for the next fetch
+                speech_queue.put(None)
+                break
+            if more.strip():
+                parts.append(more)
+                total_chars += len(more)
+        text = " ".join(parts)
+        
+        log_speech(f"Dequeued for speech: {text[:30]}..." if len(text) > 30 else f"Dequeued for speech: {text}")
+        
+        # Build the VBS script now so the VBS methods only have to run it
+        vbs_script = None
+        # Slicing reads the current method safely while the worker may be dropping it
+        active_method = speech_methods[:1]
+        if active_method and active_method[0][0] in ("simple_vbs", "wscript"):
+            try:
+                vbs_script = build_vbs_script(text)
+            except Exception as e:
+                log_speech(f"VBS script prep error: {e}")
+        
+        return text, vbs_script
+
+# Prefetch thread function - prepares the next utterance during playback
+def speech_prefetcher():
+    """Thread that dequeues and prepares utterances one ahead of the speech worker"""
+    while speech_running:
+        try:
+            item = fetch_next_speech()
+        except Exception as e:
+            log_speech(f"Speech prefetch error: {e}")
+            continue
+        if item is None:
+            break
+        prepared_queue.put(item)
+    
+    # Tell the speech worker to stop
+    prepared_queue.put(None)
+
 # Worker thread function to process speech queue
 def speech_worker():
     """Worker thread that processes the speech queue"""
-    global speech_running, engine, speech_engine_working, best_speech_method
-    
     log_speech("Speech worker thread started")
-    log_speech(f"Best speech method: {best_speech_method}")
     
-    while speech_running:
+    while True:
+        # The next utterance has already been dequeued and prepared by the prefetch thread
+        item = prepared_queue.get()
+        if item is None:
+            break
+        text, vbs_script = item
+        
         try:
-            # Get the next text to speak (with 0.5 second timeout)
-            try:
-                text = speech_queue.get(timeout=0.5)
-            except queue.Empty:
-                # Queue is empty, just continue waiting
-                continue
-            
-            # Don't try to speak empty text
-            if not text or text.strip() == "":
-                speech_queue.task_done()
-                continue
-                
-            log_speech(f"Dequeued for speech: {text[:30]}..." if len(text) > 30 else f"Dequeued for speech: {text}")
-            
-            # If we're on a non-Windows system or forcing direct methods, try different approaches
-            success = False
-            
-            # Try the best method first based on previous success
-            if best_speech_method == "pyttsx3" and engine is not None and speech_engine_working:
-                try:
-                    with speech_lock:
-                        log_speech(f"Speaking with pyttsx3: {text[:30]}..." if len(text) > 30 else f"Speaking with pyttsx3: {text}")
-                        engine.say(text)
-                        engine.runAndWait()
-                        log_speech("Speech completed with pyttsx3")
-                        success = True
-                except Exception as e:
-                    log_speech(f"pyttsx3 speech error: {e}")
-                    speech_engine_working = False
-            
-            # If pyttsx3 failed or wasn't the best method
-            if not success and platform.system() == "Windows":
-                # Try simple VBS (Windows only)
-                if best_speech_method == "simple_vbs" or not success:
-                    if speak_with_simple_vbs(text):
-                        log_speech("Speech completed with simple VBS")
-                        best_speech_method = "simple_vbs"
-                        success = True
-                
-                # If simple VBS failed or wasn't the best method
-                if best_speech_method == "wscript" or not success:
-                    if speak_with_wscript(text):
-                        log_speech("Speech completed with wscript")
-                        best_speech_method = "wscript"
-                        success = True
-                
-                # If wscript failed or wasn't the best method
-                if best_speech_method == "powershell" or not success:
-                    if speak_with_powershell(text):
-                        log_speech("Speech completed with PowerShell")
-                        best_speech_method = "powershell"
-                        success = True
-            
-            # If we're on a non-Windows system and pyttsx3 failed, we don't have other options
-            if not success and platform.system() != "Windows":
+            # Speak with the preferred method, dropping to the next one only on failure
+            while speech_methods:
+                name, speak = speech_methods[0]
+                if speak(text, vbs_script):
+                    log_speech(f"Speech completed with {name}")
+                    break
+                log_speech(f"Speech method {name} failed, trying the next one")
+                speech_methods.pop(0)
+            else:
                 log_speech("No speech methods available for this platform")
             
-            # Mark the task as done
-            speech_queue.task_done()
-            
         except Exception as e:
             log_speech(f"Speech worker error: {e}")
-            # If there was a text to speak, just mark it as done
-            if 'text' in locals() and text:
-                speech_queue.task_done()
     
     log_speech("Speech worker thread stopping")
 
-# Start the speech worker thread
-speech_thread = threading.Thread(target=speech_worker, name="FRIDAY-SpeechWorker")
-speech_thread.daemon = True
-speech_thread.start()
+# Speech worker and prefetch threads - only needed when speech doesn't go
+# straight to SAPI, so on Windows with pywin32 they start on first fallback
+speech_thread = None
+prefetch_thread = None
+speech_worker_lock = threading.Lock()
+
+def start_speech_worker():
+    """Start the speech worker and prefetch threads if they aren't running"""
+    global speech_thread, prefetch_thread
+    with speech_worker_lock:
+        if speech_thread is not None:
+            return
+        speech_thread = threading.Thread(target=speech_worker, name="FRIDAY-SpeechWorker")
+        speech_thread.daemon = True
+        speech_thread.start()
+        
+        prefetch_thread = threading.Thread(target=speech_prefetcher, name="FRIDAY-SpeechPrefetch")
+        prefetch_thread.daemon = True
+        prefetch_thread.start()
+
+if not use_direct_sapi:
+    start_speech_worker()
 
 def speak_text(text):
     """
@@ -287,15 +637,55 @@ def speak_text(text):
         None
     """
     # Don't try to speak empty text
-    if not text or text.strip() == "":
+    if not text or not text.strip():
         return
         
     # Log to file instead of printing to console
     log_speech(f"Queuing for speech: {text}")
     
+    # On Windows, SAPI queues and plays the text asynchronously by itself
+    if use_direct_sapi:
+        if speak_with_sapi(text, wait=False):
+            return
+        start_speech_worker()
+    
     # Add the text to the speech queue for the worker thread to process
     speech_queue.put(text)
 
+# Text collected by speak_queue, per calling thread, until speak_flush
+pending_speech = threading.local()
+
+def speak_queue(text):
+    """
+    Add text to this thread's pending utterance without speaking it yet
+    
+    Args:
+        text (str): The text to add
+        
+    Returns:
+        None
+    """
+    if not text or not text.strip():
+        return
+    parts = getattr(pending_speech, "parts", None)
+    if parts is None:
+        parts = pending_speech.parts = []
+    parts.append(text.strip())
+
+def speak_flush():
+    """
+    Speak everything queued with speak_queue on this thread as one utterance.
+    The engine paces the sentences itself, so callers don't need to sleep
+    between them.
+    
+    Returns:
+        None
+    """
+    parts = getattr(pending_speech, "parts", None)
+    if parts:
+        pending_speech.parts = []
+        speak_text(" ".join(parts))
+
 def get_input():
     """
     Get input from the user
@@ -315,6 +705,10 @@ def respond(text):
     Returns:
         str: The response text (for convenience)
     """
+    # Nothing to log or speak for an empty response
+    if not text or not text.strip():
+        return text
+    
     # Only log the response, don't print to console as it will be handled by UI
     log_speech(f"Response: {text}")
     
@@ -332,13 +726,56 @@ def cleanup():
     """Cleanup resources when the program exits"""
     global speech_running, speech_log_file
     
-    # Stop the speech worker thread
+    # Stop the speech threads - the None sentinel wakes the blocked prefetch thread
     speech_running = False
+    speech_queue.put(None)
     
     # Wait for the thread to finish (with timeout)
-    if 'speech_thread' in globals() and speech_thread.is_alive():
+    if speech_thread is not None and speech_thread.is_alive():
         speech_thread.join(timeout=1.0)
     
+    # Give SAPI's own queue the same grace period to finish the last utterance
+    voice = getattr(sapi_local, "voice", None)
+    if voice is not None:
+        try:
+            voice.WaitUntilDone(1000)
+        except Exception:
+            pass
+    
+    # Stop any speech helper process that is still running
+    process = speech_process
+    if process is not None and process.poll() is None:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+    
+    # Close the PowerShell session - exit lets it finish the current sentence
+    # within the grace period, after which it is terminated
+    process = powershell_process
+    if process is not None and process.poll() is None:
+        try:
+            process.stdin.write(b"exit\n")
+            process.stdin.close()
+            process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            try:
+                process.terminate()
+            except OSError:
+                pass
+    
+    # Remove the reusable temp VBS files
+    for temp_file in (VBS_TEMP, VBS_TEMP_WSCRIPT):
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+    
+    # Flush any queued log lines before closing the file
+    if speech_log_thread is not None and speech_log_thread.is_alive():
+        speech_log_queue.put(None)
+        speech_log_thread.join(timeout=1.0)
+    
     # Close the speech log file
     if speech_log_file:
         try:
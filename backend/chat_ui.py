@@ -1,35 +1,86 @@
 import tkinter as tk
 from tkinter import scrolledtext, Entry, Button, END, messagebox, Frame, Label, StringVar, BooleanVar, Menu
 import threading
+import queue
 import sys
 import time
 import os
-from brain.brain import process_command, get_time_greeting
-from brain.text import speak_text, speech_running
 import re
 import traceback
+import collections
+import textwrap
+import tkinter.font as tkfont
+
+# Speech processing status messages that shouldn't reach the console or the chat
+SPEECH_FILTERS = (
+    "[TTS]",               # TTS messages
+    "Speaking:",           # "Speaking: " messages
+    "Speech completed",
+    "Queuing for speech",
+    "Dequeued for speech",
+    "Speaking with",
+    "speech error",
+    "speech worker",
+    "pyttsx3",             # Any pyttsx3 messages
+)
+SPEECH_FILTER_RE = re.compile("|".join(re.escape(phrase) for phrase in SPEECH_FILTERS))
+
+# Sentence boundaries, and the intro sentence of web search results
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+SEARCH_INTRO_RE = re.compile(r"(Here's what I found[^.!?]*[.!?])")
+
+# Runs of dots or spaces of any length, each collapsed to a single character.
+# Only spaces - line breaks in responses are kept.
+COLLAPSE_RUNS = r"\.{2,}| {2,}"
+
+def build_cleaner(replacements):
+    """
+    Build a function that applies literal text replacements, and collapses runs
+    of dots and spaces, in a single pass
+    
+    Args:
+        replacements (dict): Maps each text to find to its replacement
+        
+    Returns:
+        function: Takes a string and returns it with all replacements applied
+    """
+    pattern = re.compile("|".join([*(re.escape(old) for old in replacements), COLLAPSE_RUNS]))
+    
+    def replace(match):
+        text = match.group(0)
+        # Anything that isn't a literal replacement is a run of one character
+        return replacements.get(text, text[0])
+    
+    return lambda text: pattern.sub(replace, text)
+
+# Formatting fixes for web search results, applied before display
+RESPONSE_FIXES = {
+    "More atWikipedia": "More at Wikipedia",
+}
+clean_response = build_cleaner(RESPONSE_FIXES)
+
+# Web search results also get their intro reworded before they are spoken
+clean_speech = build_cleaner({
+    "Here's what I found online:": "Here's what I found:",
+    "Here's what I found from Wikipedia:": "Here's what I found from Wikipedia.",
+    **RESPONSE_FIXES,
+})
 
 # Redirect standard output to prevent speech processing messages from appearing in the console
 class OutputRedirector:
     def __init__(self):
-        self.buffer = []
+        # Tail of recent output only, so a long session doesn't keep every write
+        self.buffer = collections.deque(maxlen=1024)
         self.old_stdout = sys.stdout
+        # Background threads print too, so keep their writes from interleaving
+        self.lock = threading.Lock()
         
     def write(self, text):
         # Filter out speech processing messages
-        if text.strip() and not any(msg in text for msg in [
-            "[TTS]",               # Filter for TTS messages
-            "Speaking:",           # Filter for "Speaking: " messages
-            "Speech completed", 
-            "Queuing for speech", 
-            "Dequeued for speech",
-            "Speaking with",
-            "speech error",
-            "speech worker",
-            "pyttsx3"              # Filter any pyttsx3 messages
-        ]):
-            self.old_stdout.write(text)
-            self.buffer.append(text)
+        if text.strip() and not SPEECH_FILTER_RE.search(text):
+            with self.lock:
+                self.old_stdout.write(text)
+                self.buffer.append(text)
             
     def flush(self):
         self.old_stdout.flush()
@@ -42,8 +93,19 @@ output_redirector = OutputRedirector()
 sys.stdout = output_redirector
 
 class FridayChatUI:
+    # Lines kept in the chat widget - older messages are removed from the widget
+    # and kept in the history, since Tk's Text widget slows down as it grows
+    MAX_VISIBLE_LINES = 2000
+    # Messages kept in memory, and how many to bring back when scrolled to the top
+    MAX_HISTORY = 10000
+    REHYDRATE_BATCH = 50
+    
     def __init__(self, root):
         self.root = root
+        
+        # Error log, opened once and kept open instead of reopened for every error.
+        # main() creates the logs directory before the UI is built.
+        self.error_log = open("logs/friday_error.log", "a", encoding="utf-8")
         self.root.title("FRIDAY - Personal AI Assistant")
         self.root.geometry("900x600")  # Larger default size
         self.root.minsize(600, 400)    # Set minimum window size
@@ -107,10 +169,12 @@ class FridayChatUI:
         self.help_menu.add_command(label="About FRIDAY", command=self.show_about)
         self.help_menu.add_command(label="Commands", command=self.show_commands)
         
-        # Chat display area with custom tag configuration for different message types
+        # Chat display area with custom tag configuration for different message types.
+        # Messages are wrapped in Python before insertion (see wrap_text), so Tk
+        # doesn't have to re-wrap the whole widget on every resize.
         self.chat_area = scrolledtext.ScrolledText(
             self.main_frame, 
-            wrap=tk.WORD, 
+            wrap=tk.NONE, 
             font=("Consolas", 11),
             padx=30,  
             pady=20,
@@ -120,6 +184,23 @@ class FridayChatUI:
         self.chat_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.chat_area.config(state=tk.DISABLED)
         
+        # Every displayed message as (sender, message), plus a mark at the start
+        # of each message still in the widget, oldest first
+        self.history = collections.deque(maxlen=self.MAX_HISTORY)
+        self.visible_marks = collections.deque()
+        self.mark_counter = 0
+        
+        # Bring back older messages when the user scrolls to the top
+        for sequence in ("<MouseWheel>", "<Button-4>"):
+            self.chat_area.bind(sequence, self.on_chat_scroll, add="+")
+        self.chat_area.vbar.bind("<ButtonRelease-1>", self.on_chat_scroll, add="+")
+        
+        # Wrap width in characters, recalculated shortly after the window stops resizing
+        self.chat_font = tkfont.Font(font=("Consolas", 11))
+        self.wrap_columns = 100
+        self.resize_job = None
+        self.chat_area.bind("<Configure>", self.on_chat_resize, add="+")
+        
         # Configure tags for different message types
         self.configure_chat_tags()
         
@@ -170,7 +251,14 @@ class FridayChatUI:
         )
         self.search_status.pack(side=tk.RIGHT, padx=30, pady=5, anchor="se")
         
+        # Widgets that only take the theme's background color
+        self.bg_widgets = (self.root, self.main_frame, self.bottom_frame, self.input_frame, self.status_bar)
+        
+        # In-window message panel currently shown, if any
+        self.toast = None
+        
         # Apply initial theme
+        self.current_theme = None
         self.toggle_theme()
         
         # Set focus to input field
@@ -179,6 +267,21 @@ class FridayChatUI:
         # Variable to track last message sender
         self.last_sender = None
         
+        # Number of messages shown since the chat was last cleared
+        self.message_count = 0
+        
+        # UI updates from the worker thread - post_ui queues them and wakes the
+        # Tk thread with a virtual event, which drains everything pending
+        self.ui_q = queue.SimpleQueue()
+        self.root.bind("<<ChatUpdate>>", self.on_ui_update)
+        
+        # One long-lived thread processes commands and speech in order, instead
+        # of a new thread per message - started after ui_q exists, since it
+        # posts its results there. Items are ("command", text), ("speak", text)
+        # or ("greet", None).
+        self.cmd_q = queue.Queue()
+        threading.Thread(target=self.command_worker, name="FRIDAY-Commands", daemon=True).start()
+        
         # Add version info to status bar
         version_label = Label(self.status_bar, text="FRIDAY v1.1.0", font=("Arial", 8))
         version_label.pack(side=tk.RIGHT, padx=10, pady=2)
@@ -195,14 +298,16 @@ class FridayChatUI:
     def toggle_theme(self):
         """Switch between light and dark theme"""
         theme = "dark" if self.is_dark_mode.get() else "light"
+        
+        # Nothing to do if this theme is already applied
+        if theme == self.current_theme:
+            return
+        self.current_theme = theme
         colors = self.theme_colors[theme]
         
         # Apply colors to main window
-        self.root.configure(bg=colors["bg"])
-        self.main_frame.configure(bg=colors["bg"])
-        self.bottom_frame.configure(bg=colors["bg"])
-        self.input_frame.configure(bg=colors["bg"])
-        self.status_bar.configure(bg=colors["bg"])
+        for widget in self.bg_widgets:
+            widget.configure(bg=colors["bg"])
         
         # Apply colors to chat area
         self.chat_area.configure(bg=colors["bg"], fg=colors["text"])
@@ -214,15 +319,10 @@ class FridayChatUI:
         self.chat_area.tag_configure("ai_label", foreground=colors["ai_text"])
         self.chat_area.tag_configure("system", foreground=colors["ai_text"])
         
-        # Apply colors to labels
+        # Apply colors to labels, including the current status color
         self.friday_label.configure(bg=colors["bg"], fg=colors["text"])
-        self.search_status.configure(bg=colors["bg"])
-        
-        # Update status color
-        if self.status_text.get() == "ONLINE":
-            self.search_status.config(fg=colors["status_online"])
-        else:
-            self.search_status.config(fg=colors["status_busy"])
+        status_color = colors["status_online"] if self.status_text.get() == "ONLINE" else colors["status_busy"]
+        self.search_status.configure(bg=colors["bg"], fg=status_color)
         
         # Apply colors to input field
         self.input_field.configure(
@@ -241,13 +341,69 @@ class FridayChatUI:
         if self.hint_text.get() == "":
             self.hint_text.set("Type your message here...")
     
+    def show_toast(self, title, message, buttons=(("OK", None),)):
+        """
+        Show a message in a panel inside the main window instead of a modal dialog,
+        so the event loop keeps running (and UI updates keep arriving) meanwhile
+        
+        Args:
+            title (str): Heading shown above the message
+            message (str): The message text
+            buttons (tuple): (label, callback) pairs; every button closes the
+                panel, then runs its callback if it has one
+        """
+        # Only one panel at a time
+        if self.toast is not None:
+            self.toast.destroy()
+        
+        colors = self.theme_colors[self.current_theme]
+        self.toast = Frame(
+            self.main_frame,
+            bg=colors["input_bg"],
+            highlightthickness=1,
+            highlightbackground=colors["accent"],
+            padx=20,
+            pady=15
+        )
+        Label(self.toast, text=title, font=("Arial", 12, "bold"),
+              bg=colors["input_bg"], fg=colors["text"]).pack(anchor="w")
+        Label(self.toast, text=message, font=("Consolas", 10), justify=tk.LEFT, wraplength=500,
+              bg=colors["input_bg"], fg=colors["text"]).pack(anchor="w", pady=(5, 10))
+        
+        button_row = Frame(self.toast, bg=colors["input_bg"])
+        button_row.pack(anchor="e")
+        for label, callback in buttons:
+            Button(button_row, text=label, relief=tk.FLAT, padx=10,
+                   bg=colors["accent"], fg=colors["text"],
+                   command=lambda callback=callback: self.close_toast(callback)).pack(side=tk.LEFT, padx=(5, 0))
+        
+        self.toast.place(relx=0.5, rely=0.4, anchor="center")
+        self.toast.lift()
+    
+    def close_toast(self, callback=None):
+        """Close the message panel, then run the chosen button's callback"""
+        if self.toast is not None:
+            self.toast.destroy()
+            self.toast = None
+        if callback is not None:
+            callback()
+    
     def clear_chat(self):
         """Clear the chat history"""
-        if messagebox.askyesno("Clear Chat", "Are you sure you want to clear the chat history?"):
-            self.chat_area.config(state=tk.NORMAL)
-            self.chat_area.delete(1.0, tk.END)
-            self.chat_area.config(state=tk.DISABLED)
-            self.update_chat("FRIDAY", "Chat history cleared. How can I help you?")
+        self.show_toast("Clear Chat", "Are you sure you want to clear the chat history?",
+                        (("Yes", self.clear_chat_history), ("No", None)))
+    
+    def clear_chat_history(self):
+        """Remove every message from the chat area and the history"""
+        self.chat_area.config(state=tk.NORMAL)
+        self.chat_area.delete(1.0, tk.END)
+        self.chat_area.config(state=tk.DISABLED)
+        for mark in self.visible_marks:
+            self.chat_area.mark_unset(mark)
+        self.visible_marks.clear()
+        self.history.clear()
+        self.message_count = 0
+        self.show_response("Chat history cleared. How can I help you?")
     
     def show_about(self):
         """Show information about FRIDAY"""
@@ -258,7 +414,7 @@ class FridayChatUI:
             "FRIDAY is a personal AI assistant designed to help you with daily tasks, "
             "provide information, and control your applications."
         )
-        messagebox.showinfo("About FRIDAY", about_text)
+        self.show_toast("About FRIDAY", about_text)
     
     def show_commands(self):
         """Show available commands"""
@@ -278,16 +434,20 @@ class FridayChatUI:
             "Email:\n"
             "- write email [type] - Generate email templates\n"
         )
-        messagebox.showinfo("FRIDAY Commands", commands_text)
+        self.show_toast("FRIDAY Commands", commands_text)
     
     def on_closing(self):
         """Handle window close event"""
-        if messagebox.askokcancel("Quit", "Do you want to quit FRIDAY?"):
-            # Display and speak goodbye message
-            self.update_chat("FRIDAY", "Goodbye! Have a great day!")
-            
-            # Give time for speech to complete
-            self.root.after(2000, self.root.destroy)
+        self.show_toast("Quit", "Do you want to quit FRIDAY?",
+                        (("OK", self.quit_friday), ("Cancel", None)))
+    
+    def quit_friday(self):
+        """Say goodbye and close the window"""
+        # Display and speak goodbye message
+        self.show_response("Goodbye! Have a great day!")
+        
+        # Give time for speech to complete
+        self.root.after(2000, self.root.destroy)
     
     def on_ctrl_c(self, event):
         """Handle Ctrl+C event"""
@@ -297,57 +457,164 @@ class FridayChatUI:
         """Add a message to the chat area with different styling for user and AI"""
         try:
             # Skip any speech processing status messages that might have gotten through
-            if any(msg in message for msg in [
-                "[TTS]",               # Filter for TTS messages
-                "Speaking:",           # Filter for "Speaking: " messages
-                "Speech completed", 
-                "Queuing for speech", 
-                "Dequeued for speech",
-                "Speaking with",
-                "speech error",
-                "speech worker",
-                "pyttsx3"              # Filter any pyttsx3 messages
-            ]):
+            if SPEECH_FILTER_RE.search(message):
                 return
                 
             self.chat_area.config(state=tk.NORMAL)
-            
-            # Add proper line spacing based on current state and sender
-            current_index = self.chat_area.index('end-1c')
-            
-            if current_index != '1.0':  # Not the first message
-                # Get the last line of text to check if we need spacing
-                last_line = self.chat_area.get("end-2l", "end-1c").strip()
-                
-                # Add appropriate spacing
-                if last_line and not last_line.isspace():
-                    self.chat_area.insert(tk.END, "\n")  # Single line break for spacing
-            
-            if sender == "You":
-                # Add user message with proper label
-                self.chat_area.insert(tk.END, "You:", "user_label")
-                self.chat_area.insert(tk.END, f" {message}", "user")
-            elif sender == "FRIDAY":
-                # Add FRIDAY message with proper label
-                self.chat_area.insert(tk.END, "FRIDAY:", "ai_label")
-                self.chat_area.insert(tk.END, f" {message}", "ai")
-                
-                # Speak the response
-                self.speak_message(message)
-            else:
-                # System messages
-                self.chat_area.insert(tk.END, f"{message}", "system")
+            self.append_message(sender, message)
+            self.history.append((sender, message))
             
             # Remember the last sender for spacing
             self.last_sender = sender
             
+            # Drop the oldest whole messages from the widget once it grows past
+            # the cap - they stay in self.history for scrolling back
+            line_count = int(self.chat_area.index('end-1c').split('.')[0])
+            while line_count > self.MAX_VISIBLE_LINES and len(self.visible_marks) > 1:
+                oldest = self.visible_marks.popleft()
+                self.chat_area.delete("1.0", self.visible_marks[0])
+                self.chat_area.mark_unset(oldest)
+                line_count = int(self.chat_area.index('end-1c').split('.')[0])
+            
             self.chat_area.see(tk.END)
             self.chat_area.config(state=tk.DISABLED)
         except Exception as e:
             # Log error without printing to console
-            os.makedirs("logs", exist_ok=True)
-            with open("logs/friday_error.log", "a") as f:
-                f.write(f"{time.ctime()}: Error updating chat: {e}\n")
+            self.log_error(f"Error updating chat: {e}")
+    
+    def append_message(self, sender, message):
+        """Insert a message at the end of the chat area and mark where it starts"""
+        # Single line break between messages - tracked here instead of
+        # reading the last line back out of the widget
+        if self.message_count > 0:
+            self.chat_area.insert(tk.END, "\n")
+        self.message_count += 1
+        
+        # Mark where the message starts; left gravity keeps the mark in front
+        # of the text inserted at it, then it follows later inserts above it
+        mark = self.new_message_mark()
+        self.chat_area.mark_set(mark, "end-1c")
+        self.chat_area.mark_gravity(mark, tk.LEFT)
+        
+        # Label and text go in with one insert call
+        self.chat_area.insert(tk.END, *self.message_chunks(sender, message))
+        
+        self.chat_area.mark_gravity(mark, tk.RIGHT)
+        self.visible_marks.append(mark)
+    
+    def wrap_text(self, text, first_indent=0):
+        """
+        Wrap text to the chat width, keeping the line breaks it already has
+        
+        Args:
+            text (str): The text to wrap
+            first_indent (int): Columns already used on the first line (the label)
+            
+        Returns:
+            str: The wrapped text
+        """
+        width = self.wrap_columns
+        lines = []
+        for line in text.split("\n"):
+            if len(line) + first_indent > width:
+                line = textwrap.fill(line, width=width, initial_indent=" " * first_indent)[first_indent:]
+            lines.append(line)
+            first_indent = 0
+        return "\n".join(lines)
+    
+    def on_chat_resize(self, event=None):
+        """Re-wrap the chat once resizing has paused for 200ms"""
+        if self.resize_job is not None:
+            self.root.after_cancel(self.resize_job)
+        self.resize_job = self.root.after(200, self.rewrap_chat)
+    
+    def rewrap_chat(self):
+        """Re-insert the visible messages wrapped to the chat area's new width"""
+        self.resize_job = None
+        text_width = self.chat_area.winfo_width() - 2 * int(self.chat_area.cget("padx"))
+        columns = max(20, text_width // self.chat_font.measure("0"))
+        if columns == self.wrap_columns:
+            return
+        self.wrap_columns = columns
+        
+        try:
+            # The visible messages are the newest entries in the history
+            visible_count = len(self.visible_marks)
+            visible = list(self.history)[len(self.history) - visible_count:]
+            first, last = self.chat_area.yview()
+            
+            self.chat_area.config(state=tk.NORMAL)
+            self.chat_area.delete("1.0", tk.END)
+            for mark in self.visible_marks:
+                self.chat_area.mark_unset(mark)
+            self.visible_marks.clear()
+            self.message_count = 0
+            for sender, message in visible:
+                self.append_message(sender, message)
+            
+            # Stay at the bottom if we were there, otherwise roughly in place
+            if last >= 1.0:
+                self.chat_area.see(tk.END)
+            else:
+                self.chat_area.yview_moveto(first)
+            self.chat_area.config(state=tk.DISABLED)
+        except Exception as e:
+            self.log_error(f"Error re-wrapping chat: {e}")
+    
+    def show_response(self, message):
+        """Display a FRIDAY message from the Tk thread and have the worker speak it"""
+        self.update_chat("FRIDAY", message)
+        self.cmd_q.put(("speak", message))
+    
+    def log_error(self, message):
+        """Append a timestamped line to the error log"""
+        try:
+            self.error_log.write(f"{time.ctime()}: {message}\n")
+            self.error_log.flush()
+        except (OSError, ValueError):
+            pass  # Log file unavailable or already closed
+    
+    def message_chunks(self, sender, message):
+        """Return the text, tag, text, tag... arguments for inserting a message"""
+        if sender == "You":
+            return ("You:", "user_label", f" {self.wrap_text(message, len('You: '))}", "user")
+        if sender == "FRIDAY":
+            return ("FRIDAY:", "ai_label", f" {self.wrap_text(message, len('FRIDAY: '))}", "ai")
+        # System messages
+        return (self.wrap_text(f"{message}"), "system")
+    
+    def new_message_mark(self):
+        """Return a unique mark name for the start of a message"""
+        self.mark_counter += 1
+        return f"msg{self.mark_counter}"
+    
+    def on_chat_scroll(self, event=None):
+        """Check for the top of the chat once the scroll has been applied"""
+        self.root.after_idle(self.rehydrate_history)
+    
+    def rehydrate_history(self):
+        """Put older messages from the history back when scrolled to the top"""
+        hidden = len(self.history) - len(self.visible_marks)
+        if hidden <= 0 or self.chat_area.yview()[0] > 0.0:
+            return
+        
+        try:
+            self.chat_area.config(state=tk.NORMAL)
+            first_visible = self.visible_marks[0] if self.visible_marks else "1.0"
+            
+            # Insert newest-first at the top, so each message ends up above the last
+            for index in range(hidden - 1, max(hidden - self.REHYDRATE_BATCH, 0) - 1, -1):
+                sender, message = self.history[index]
+                self.chat_area.insert("1.0", *self.message_chunks(sender, message), "\n", ())
+                mark = self.new_message_mark()
+                self.chat_area.mark_set(mark, "1.0")
+                self.visible_marks.appendleft(mark)
+            
+            # Keep the message the user was looking at in view
+            self.chat_area.yview(first_visible)
+            self.chat_area.config(state=tk.DISABLED)
+        except Exception as e:
+            self.log_error(f"Error restoring chat history: {e}")
     
     def set_search_status(self, is_searching):
         """Update the search status indicator"""
@@ -387,29 +654,80 @@ class FridayChatUI:
             # Update status to searching
             self.set_search_status(True)
             
-            # Process in a separate thread to keep UI responsive
-            threading.Thread(target=self.process_and_respond, args=(user_input,), daemon=True).start()
+            # Hand off to the command worker thread to keep UI responsive
+            self.cmd_q.put(("command", user_input))
         except Exception as e:
             # Log error to logs directory
-            os.makedirs("logs", exist_ok=True)
-            with open("logs/friday_error.log", "a") as f:
-                f.write(f"{time.ctime()}: Error sending message: {e}\n")
-            messagebox.showerror("Error", f"An error occurred while sending message: {e}")
+            self.log_error(f"Error sending message: {e}")
+            self.show_toast("Error", f"An error occurred while sending message: {e}")
         
+    def post_ui(self, *item):
+        """Queue a UI update from the worker thread and wake the Tk thread to apply it"""
+        self.ui_q.put(item)
+        try:
+            self.root.event_generate("<<ChatUpdate>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # Window already closed
+    
+    def on_ui_update(self, event=None):
+        """Apply every UI update queued by the worker thread"""
+        status = None
+        while True:
+            try:
+                item = self.ui_q.get_nowait()
+            except queue.Empty:
+                break
+            kind = item[0]
+            if kind == "chat":
+                self.update_chat(item[1], item[2])
+            elif kind == "status":
+                # Only the last status change in a batch needs drawing
+                status = item[1]
+            elif kind == "close":
+                self.root.after(item[1], self.root.destroy)
+        
+        if status is not None:
+            self.set_search_status(status)
+    
+    def command_worker(self):
+        """Process queued user input and speech one item at a time, off the Tk thread"""
+        while True:
+            kind, text = self.cmd_q.get()
+            if kind == "speak":
+                self.speak_message(text)
+            elif kind == "greet":
+                self.greet()
+            else:
+                self.process_and_respond(text)
+    
+    def greet(self):
+        """Show and speak the welcome message, loading the brain modules on first use"""
+        try:
+            from brain.brain import get_time_greeting
+            welcome_message = f"{get_time_greeting()} I'm FRIDAY, at your service. How can I help you today?"
+        except Exception as e:
+            self.log_error(f"Error loading FRIDAY: {e}")
+            welcome_message = "I'm FRIDAY, at your service. How can I help you today?"
+        self.post_ui("chat", "FRIDAY", welcome_message)
+        self.speak_message(welcome_message)
+    
     def process_and_respond(self, user_input):
         """Process the user input in a separate thread and update UI with response"""
         try:
             # Check for exit command
             if user_input.lower() in ["exit", "quit", "bye", "goodbye"]:
                 response = "Goodbye! Have a great day!"
-                self.root.after(0, lambda: self.update_chat("FRIDAY", response))
-                self.root.after(0, lambda: self.set_search_status(False))
+                self.post_ui("chat", "FRIDAY", response)
+                self.post_ui("status", False)
+                self.speak_message(response)
                 
                 # Allow time for goodbye speech to complete
-                self.root.after(2500, self.root.destroy)
+                self.post_ui("close", 2500)
                 return
                 
-            # Get response from brain
+            # Get response from brain - imported here, off the Tk thread, so the
+            # window doesn't wait for the brain modules to load
+            from brain.brain import process_command
             response = process_command(user_input.lower())
             
             # Extract the important parts of the response for cleaner speech
@@ -423,37 +741,50 @@ class FridayChatUI:
             
             # Ensure web search results are properly formatted for speech
             # Fix common formatting issues to improve speech quality
-            cleaned_response = cleaned_response.replace("More atWikipedia", "More at Wikipedia")
-            cleaned_response = cleaned_response.replace("..", ".")
-            cleaned_response = cleaned_response.replace("  ", " ")
+            cleaned_response = clean_response(cleaned_response)
             
             # Update UI with original response (safely from main thread)
-            self.root.after(0, lambda: self.update_chat("FRIDAY", cleaned_response))
-            self.root.after(0, lambda: self.set_search_status(False))
+            self.post_ui("chat", "FRIDAY", cleaned_response)
+            self.post_ui("status", False)
+            
+            # Speak here, already off the Tk thread, so the pauses between
+            # sentences never block the UI
+            self.speak_message(cleaned_response)
         except Exception as e:
             error_msg = f"Sorry, I encountered an error: {str(e)}"
-            self.root.after(0, lambda: self.update_chat("FRIDAY", error_msg))
-            self.root.after(0, lambda: self.set_search_status(False))
+            self.post_ui("chat", "FRIDAY", error_msg)
+            self.post_ui("status", False)
+            self.speak_message(error_msg)
             # Log error to logs directory
-            os.makedirs("logs", exist_ok=True)
-            with open("logs/friday_error.log", "a") as f:
-                f.write(f"{time.ctime()}: Error processing command: {e}\n")
+            self.log_error(f"Error processing command: {e}")
     
     def speak_message(self, message):
         """Speak the entire message, breaking it down if needed for better speech processing"""
         try:
+            # Loading the speech module starts the TTS engine, so it waits until
+            # there is something to say
+            from brain.text import speak_text, speak_queue, speak_flush
+            
+            # Speech status messages are never shown, so don't speak them either
+            if SPEECH_FILTER_RE.search(message):
+                return
+            
             # Clean the message first to improve speech quality
             speech_message = message
             
             # Remove any duplicate sentences that often appear in web search results
-            sentences = re.split(r'(?<=[.!?])\s+', speech_message)
+            sentences = SENTENCE_SPLIT_RE.split(speech_message)
             unique_sentences = []
+            # Normalized forms of the last three kept sentences, so each one is
+            # normalized once instead of again for every later comparison
+            recent_sentences = collections.deque(maxlen=3)
             for sentence in sentences:
                 # Strip and normalize the sentence for comparison
                 clean_sentence = ' '.join(sentence.lower().split())
                 # Only add if not a near-duplicate of previous sentence
-                if not any(clean_sentence in ' '.join(prev.lower().split()) for prev in unique_sentences[-3:] if prev):
+                if not any(clean_sentence in prev for prev in recent_sentences if prev):
                     unique_sentences.append(sentence)
+                    recent_sentences.append(clean_sentence)
             
             speech_message = ' '.join(unique_sentences)
             
@@ -467,53 +798,39 @@ class FridayChatUI:
                         speech_message = parts[0] + (seconds_parts[1] if len(seconds_parts) > 1 else "")
                 
                 # Clean up formatting for better speech
-                speech_message = speech_message.replace("Here's what I found online:", "Here's what I found:")
-                speech_message = speech_message.replace("Here's what I found from Wikipedia:", "Here's what I found from Wikipedia.")
-                speech_message = speech_message.replace("More atWikipedia", "More at Wikipedia")
-                speech_message = speech_message.replace("..", ".")
-                speech_message = speech_message.replace("  ", " ")
+                speech_message = clean_speech(speech_message)
                 
                 # First speak the introduction
                 intro_parts = ["Here's what I found", "I found this information"]
                 intro_part = next((part for part in intro_parts if part in speech_message), "Here's what I found for you.")
                 
                 # Extract intro sentence
-                intro_match = re.search(r"(Here's what I found[^.!?]*[.!?])", speech_message)
+                intro_match = SEARCH_INTRO_RE.search(speech_message)
                 if intro_match:
                     intro_sentence = intro_match.group(1)
-                    speak_text(intro_sentence)
+                    speak_queue(intro_sentence)
                     
                     # Remove intro from content to avoid duplication
                     content_part = speech_message.replace(intro_sentence, "", 1).strip()
                 else:
-                    speak_text(intro_part)
+                    speak_queue(intro_part)
                     content_part = speech_message.replace("Here's what I found:", "", 1).strip()
                 
-                # Brief pause before continuing
-                time.sleep(0.3)
-                
-                # If the content is very long, break it into sentences
-                if len(content_part) > 200:
-                    sentences = re.split(r'(?<=[.!?])\s+', content_part)
-                    for sentence in sentences:
-                        if sentence.strip():
-                            speak_text(sentence.strip())
-                            time.sleep(0.1)  # Small pause between sentences
-                else:
-                    speak_text(content_part)
+                # Everything is spoken as one utterance, with the engine pacing
+                # the sentences
+                speak_queue(content_part)
+                speak_flush()
             else:
                 # For normal responses, just speak the full message
                 speak_text(speech_message)
         except Exception as e:
             # Log error to logs directory
-            os.makedirs("logs", exist_ok=True)
-            with open("logs/friday_error.log", "a") as f:
-                f.write(f"{time.ctime()}: Error speaking message: {e}\n")
+            self.log_error(f"Error speaking message: {e}")
 
 def main():
     """Main function to run the FRIDAY chat UI"""
     try:
-        # Ensure logs directory exists
+        # Ensure logs directory exists - the only place it is created
         os.makedirs("logs", exist_ok=True)
         
         # Create the main window
@@ -529,23 +846,20 @@ def main():
         # Create the FRIDAY chat UI
         app = FridayChatUI(root)
         
-        # Display welcome message after a short delay to ensure proper UI rendering
-        time_greeting = get_time_greeting()
-        welcome_message = f"{time_greeting} I'm FRIDAY, at your service. How can I help you today?"
-        
-        # Use after to ensure UI is fully loaded before showing the message
-        root.after(100, lambda: app.update_chat("FRIDAY", welcome_message))
+        # Have the command worker load the brain modules and greet the user once
+        # the UI is up, so the window shows without waiting for them
+        root.after(100, lambda: app.cmd_q.put(("greet", None)))
         
         # Start the Tkinter event loop
         root.mainloop()
         
+        # The window is gone, so nothing else will use the error log
+        app.error_log.close()
+        
     except Exception as e:
         # Log error to file and display message box
         error_msg = f"An unexpected error occurred: {str(e)}"
         
-        # Ensure logs directory exists
-        os.makedirs("logs", exist_ok=True)
-        
         with open("logs/friday_error.log", "a") as f:
             f.write(f"{time.ctime()}: {error_msg}\n")
             f.write(f"Traceback: {traceback.format_exc()}\n")
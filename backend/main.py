@@ -1,13 +1,23 @@
-from brain.text import respond, get_input, speak_text
+from brain.text import respond, get_input, speak_text, speak_queue, speak_flush
 from brain.brain import process_command, get_time_greeting
 import sys
 import time
 import os
 import re
 import argparse
+import atexit
+import logging
+import logging.handlers
 import colorama
 from colorama import Fore, Style, Back
 
+# Block-buffer stdout instead of flushing on every line; output is flushed
+# explicitly before reading input and once more at exit. This has to happen
+# before colorama wraps the stream.
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
+
 # Initialize colorama for cross-platform colored terminal output
 colorama.init(autoreset=True)
 
@@ -15,6 +25,58 @@ colorama.init(autoreset=True)
 VERSION = "1.1.0"
 BUILD_DATE = "2025-04-25"
 
+# Terminal strings built once - the banner, the input prompt and the
+# wrapping around FRIDAY's responses
+BANNER = f"""
+{Fore.CYAN}{Style.BRIGHT}
+    ███████╗██████╗ ██╗██████╗  █████╗ ██╗   ██╗
+    ██╔════╝██╔══██╗██║██╔══██╗██╔══██╗╚██╗ ██╔╝
+    █████╗  ██████╔╝██║██║  ██║███████║ ╚████╔╝ 
+    ██╔══╝  ██╔══██╗██║██║  ██║██╔══██║  ╚██╔╝  
+    ██║     ██║  ██║██║██████╔╝██║  ██║   ██║   
+    ╚═╝     ╚═╝  ╚═╝╚═╝╚═════╝ ╚═╝  ╚═╝   ╚═╝   
+                                  
+{Style.RESET_ALL}{Fore.LIGHTBLUE_EX}Female Replacement Intelligent Digital Assistant Youth{Style.RESET_ALL}
+{Fore.WHITE}Version {VERSION} | Type 'help' for commands | Type 'exit' to quit{Style.RESET_ALL}
+"""
+PROMPT = f"{Fore.GREEN}{Style.BRIGHT}\nYou:{Style.RESET_ALL} "
+RESPONSE_PREFIX = f"\n{Fore.CYAN}{Style.BRIGHT}FRIDAY:{Style.RESET_ALL} {Fore.LIGHTBLUE_EX}"
+RESPONSE_SUFFIX = Style.RESET_ALL
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Error log - records are buffered in memory and written out at the end of
+# each turn, or straight away for errors, instead of reopening the file for
+# every message.
+# delay=True opens the file on first write, after main() has created logs/.
+err_log = logging.getLogger("friday.err")
+err_log.setLevel(logging.WARNING)
+err_log.propagate = False
+error_file_handler = logging.FileHandler("logs/friday_error.log", encoding="utf-8", delay=True)
+error_file_handler.setFormatter(logging.Formatter("%(asctime)s: %(message)s", datefmt="%a %b %d %H:%M:%S %Y"))
+error_log_buffer = logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=error_file_handler)
+err_log.addHandler(error_log_buffer)
+
+# Write out anything still buffered when FRIDAY exits
+atexit.register(error_log_buffer.flush)
+
+# Common formatting issues in responses, fixed in a single pass
+CLEAN_MAP = {
+    "More atWikipedia": "More at Wikipedia",
+    "..": ".",
+    "  ": " ",
+}
+CLEAN_RE = re.compile("|".join(re.escape(old) for old in CLEAN_MAP))
+
+# Search timing note appended to web search results
+WEBSEARCH_RE = re.compile(r'Web search completed in[^\n]*?seconds')
+
+# Substrings that mean a response needs cleaning at all
+CLEAN_MARKERS = ("Web search completed in",) + tuple(CLEAN_MAP)
+
+def clean_text(text):
+    """Fix common formatting issues in a response with one regex pass"""
+    return CLEAN_RE.sub(lambda match: CLEAN_MAP[match.group(0)], text)
+
 # Parse command line arguments
 def parse_arguments():
     parser = argparse.ArgumentParser(description="FRIDAY - Personal AI Assistant")
@@ -25,76 +87,53 @@ def parse_arguments():
     return parser.parse_args()
 
 # Function to ensure the entire message is spoken, especially for web search results
-def speak_full_message(text, no_voice=False):
+def speak_full_message(text):
     """Ensure the entire message is spoken, breaking down long messages if needed"""
-    if no_voice:
-        return  # Skip voice output if voice is disabled
-        
     try:
         # Special handling for web search results which can be long
         if "Here's what I found" in text:
-            # First speak the introduction
+            # First queue the introduction - the intro and content are spoken as
+            # one utterance, with the engine pacing the sentences
             intro_part = "Here's what I found for you."
-            speak_text(intro_part)
+            speak_queue(intro_part)
             
-            # Brief pause before continuing
-            time.sleep(0.3)
-            
-            # Then speak the actual content with chunking for long responses
+            # Then the actual content
             content_part = text.replace("Here's what I found online:", "").replace("Here's what I found from Wikipedia:", "").strip()
             
             # Clean up content for better speech
-            content_part = content_part.replace("More atWikipedia", "More at Wikipedia")
-            content_part = content_part.replace("..", ".")
-            content_part = content_part.replace("  ", " ")
+            content_part = clean_text(content_part)
             
-            # If the content is very long, break it into sentences
-            if len(content_part) > 300:
-                sentences = re.split(r'(?<=[.!?])\s+', content_part)
-                for sentence in sentences:
-                    if sentence.strip():
-                        speak_text(sentence.strip())
-                        time.sleep(0.1)  # Small pause between sentences
-            else:
-                speak_text(content_part)
+            speak_queue(content_part)
+            speak_flush()
         else:
             # For normal responses, just speak the full message
             speak_text(text)
     except Exception as e:
         # Log error without printing to console
-        with open("logs/friday_error.log", "a") as f:
-            f.write(f"{time.ctime()}: Error speaking message: {e}\n")
+        err_log.warning("Error speaking message: %s", e)
 
 # Custom functions to ensure proper formatting
 def custom_respond(text, no_voice=False):
     """
     Display assistant's response with proper formatting and queue it for speech
     """
-    # Clean the text for better speech
-    cleaned_text = text
-    
-    # Clean up any "Looking up information..." or "Web search completed..." messages
-    if "Web search completed in" in text:
-        parts = text.split("Web search completed in")
-        seconds_parts = parts[1].split("seconds")
-        if len(seconds_parts) > 1:
-            cleaned_text = parts[0] + seconds_parts[1]
-            
-    # Fix common formatting issues
-    cleaned_text = cleaned_text.replace("More atWikipedia", "More at Wikipedia")
-    cleaned_text = cleaned_text.replace("..", ".")
-    cleaned_text = cleaned_text.replace("  ", " ")
-    
-    # Print FRIDAY's response with proper line break before it
-    response_text = f"\n{Fore.CYAN}{Style.BRIGHT}FRIDAY:{Style.RESET_ALL} {Fore.LIGHTBLUE_EX}{cleaned_text}{Style.RESET_ALL}"
-    print(response_text)
+    # Most responses have nothing to clean, so skip the regex passes for them
+    if not any(marker in text for marker in CLEAN_MARKERS):
+        cleaned_text = text
+    else:
+        # Clean up any "Web search completed in ... seconds" messages
+        cleaned_text = WEBSEARCH_RE.sub("", text, count=1)
+        
+        # Fix common formatting issues
+        cleaned_text = clean_text(cleaned_text)
     
-    # Force a small delay before speaking (helps with speech engine timing)
-    time.sleep(0.1)
+    # Print FRIDAY's response with proper line break before it, flushed so it
+    # shows before any speech starts
+    print(RESPONSE_PREFIX + cleaned_text + RESPONSE_SUFFIX, flush=True)
     
     # Use our custom function to speak the full message
     if not no_voice:
-        speak_full_message(cleaned_text, no_voice)
+        speak_full_message(cleaned_text)
     
     # Return the cleaned text for convenience
     return cleaned_text
@@ -103,12 +142,8 @@ def custom_get_input():
     """
     Get text input from the user with proper formatting
     """
-    # Make sure to flush stdout before displaying prompt
-    sys.stdout.flush()
-    
-    # Print the prompt with proper formatting and flush to ensure it's visible
-    prompt = f"{Fore.GREEN}{Style.BRIGHT}\nYou:{Style.RESET_ALL} "
-    sys.stdout.write(prompt)
+    # Print the prompt with proper formatting and flush everything buffered so far
+    sys.stdout.write(PROMPT)
     sys.stdout.flush()
     
     # Get user input
@@ -126,19 +161,7 @@ def custom_get_input():
 
 def display_banner():
     """Display an ASCII art banner for FRIDAY"""
-    banner = f"""
-{Fore.CYAN}{Style.BRIGHT}
-    ███████╗██████╗ ██╗██████╗  █████╗ ██╗   ██╗
-    ██╔════╝██╔══██╗██║██╔══██╗██╔══██╗╚██╗ ██╔╝
-    █████╗  ██████╔╝██║██║  ██║███████║ ╚████╔╝ 
-    ██╔══╝  ██╔══██╗██║██║  ██║██╔══██║  ╚██╔╝  
-    ██║     ██║  ██║██║██████╔╝██║  ██║   ██║   
-    ╚═╝     ╚═╝  ╚═╝╚═╝╚═════╝ ╚═╝  ╚═╝   ╚═╝   
-                                  
-{Style.RESET_ALL}{Fore.LIGHTBLUE_EX}Female Replacement Intelligent Digital Assistant Youth{Style.RESET_ALL}
-{Fore.WHITE}Version {VERSION} | Type 'help' for commands | Type 'exit' to quit{Style.RESET_ALL}
-"""
-    print(banner)
+    print(BANNER)
 
 def clean_log_files():
     """Clean log files to start fresh"""
@@ -151,17 +174,22 @@ def clean_log_files():
     # Ensure logs directory exists
     os.makedirs("logs", exist_ok=True)
     
+    # One timestamp for every backup and header in this run
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    header = f"Log file created at {time.ctime()}\n"
+    
     for log_file in log_files:
         try:
-            if os.path.exists(log_file):
-                # Backup the old log with timestamp
-                timestamp = time.strftime("%Y%m%d-%H%M%S")
-                backup_file = f"{log_file}.{timestamp}.bak"
-                os.rename(log_file, backup_file)
+            # Backup the old log with timestamp, unless there is nothing in it
+            try:
+                if os.stat(log_file).st_size > 0:
+                    os.replace(log_file, f"{log_file}.{timestamp}.bak")
+            except FileNotFoundError:
+                pass
                 
             # Create a new empty log file
             with open(log_file, "w") as f:
-                f.write(f"Log file created at {time.ctime()}\n")
+                f.write(header)
                 
             print(f"{Fore.GREEN}Cleaned log file: {log_file}{Style.RESET_ALL}")
         except Exception as e:
@@ -185,8 +213,9 @@ def main():
         if args.clean:
             clean_log_files()
         
-        # Clear the console screen for better appearance
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Clear the console screen for better appearance - colorama translates
+        # the escape codes on Windows, so no shell needs to be spawned
+        sys.stdout.write(CLEAR_SCREEN)
         
         # Display banner
         display_banner()
@@ -223,17 +252,19 @@ def main():
                 custom_respond("Goodbye! Have a great day!", args.no_voice)
                 running = False
             except Exception as e:
-                error_msg = f"Oops! I encountered an error: {str(e)}"
-                custom_respond(error_msg, args.no_voice)
-                # Log error to file
-                with open("logs/friday_error.log", "a") as f:
-                    f.write(f"{time.ctime()}: Error details: {e}\n")
+                # Log error and traceback to file through the buffered logger
+                err_log.exception("Turn failed: %s", e)
+                custom_respond(f"Oops! I encountered an error: {e}", args.no_voice)
                 
                 # Show more details in debug mode
                 if args.debug:
                     import traceback
                     traceback_str = traceback.format_exc()
                     print(f"{Fore.RED}Debug traceback: {traceback_str}{Style.RESET_ALL}")
+            finally:
+                # Write out this turn's buffered warnings so they show up live
+                # and survive a crash
+                error_log_buffer.flush()
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Program interrupted. Exiting...{Style.RESET_ALL}")
     except Exception as e:
@@ -241,8 +272,7 @@ def main():
         error_msg = f"An unexpected error occurred: {e}"
         try:
             os.makedirs("logs", exist_ok=True)
-            with open("logs/friday_error.log", "a") as f:
-                f.write(f"{time.ctime()}: {error_msg}\n")
+            err_log.error(error_msg)
                 
             # Show more details in debug mode
             if 'args' in locals() and args.debug:
@@ -3,6 +3,7 @@ from flask_cors import CORS
 import sys
 import os
 import re
+import functools
 
 # Add backend directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -23,6 +24,12 @@ logging.basicConfig(
 
 logger = logging.getLogger('friday_server')
 
+# Chart markers in brain responses, and the full marker lines to strip from them
+STOCK_CHART_RE = re.compile(r'📊 STOCK CHART: (assets/charts/[^\s\n]+)')
+MF_CHART_RE = re.compile(r'📊 MUTUAL FUND CHART: (assets/charts/[^\s\n]+)')
+STOCK_CHART_STRIP_RE = re.compile(r'📊 STOCK CHART: assets/charts/[^\n]+\n\n')
+MF_CHART_STRIP_RE = re.compile(r'📊 MUTUAL FUND CHART: assets/charts/[^\n]+\n\n')
+
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
 # Create charts directory if it doesn't exist
@@ -35,18 +42,43 @@ try:
     with open(test_file_path, 'w') as f:
         f.write('test')
     os.remove(test_file_path)
-    logger.info(f"Charts directory is writable: {charts_dir}")
+    logger.info("Charts directory is writable: %s", charts_dir)
 except Exception as e:
-    logger.error(f"Charts directory may not be writable: {charts_dir}, Error: {str(e)}")
+    logger.error("Charts directory may not be writable: %s, Error: %s", charts_dir, e)
     # Log directory permissions
     if os.name == 'posix':  # Unix-like systems
-        logger.info(f"Attempting to set directory permissions for {charts_dir}")
+        logger.info("Attempting to set directory permissions for %s", charts_dir)
         try:
             import stat
             os.chmod(charts_dir, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
             logger.info("Permissions updated for charts directory")
         except Exception as e:
-            logger.error(f"Failed to set permissions: {str(e)}")
+            logger.error("Failed to set permissions: %s", e)
+
+@functools.lru_cache(maxsize=1024)
+def chart_exists(path):
+    """Cached existence check for chart files, cleared whenever the brain may have written new ones"""
+    return os.path.exists(path)
+
+# waitress worker threads - each request runs process_command on its own
+# thread, and those calls are long-running, so the pool is oversized
+SERVER_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+def run_command(user_message):
+    """
+    Process a message through FRIDAY's brain on the calling thread.
+    
+    Args:
+        user_message (str): The user's message
+        
+    Returns:
+        str: FRIDAY's response
+    """
+    try:
+        return process_command(user_message)
+    finally:
+        # The brain may have just written charts that were cached as missing
+        chart_exists.cache_clear()
 
 # Initialize Flask app
 app = Flask(__name__, static_folder='../frontend')
@@ -62,45 +94,45 @@ def friday_endpoint():
             return jsonify({'error': 'No message provided'}), 400
             
         user_message = data['message']
-        logger.info(f"Received message: {user_message}")
+        logger.info("Received message: %s", user_message)
         
         # Process the message using FRIDAY's brain
         start_time = time.time()
-        response = process_command(user_message)
+        response = run_command(user_message)
         processing_time = time.time() - start_time
         
-        logger.info(f"Processing time: {processing_time:.2f} seconds")
-        logger.info(f"Response: {response[:100]}..." if len(response) > 100 else f"Response: {response}")
+        logger.info("Processing time: %.2f seconds", processing_time)
+        logger.info("Response: %s%s", response[:100], "..." if len(response) > 100 else "")
         
         # Check if response contains chart path - look for both stock and mutual fund charts
         chart_path = None
         
         # Debug: Log the first 200 chars of response to check for the chart marker
-        logger.debug(f"Response first 200 chars: {response[:200]}")
-        
-        # Improved regex patterns with more flexible matching
-        stock_chart_pattern = r'📊 STOCK CHART: (assets/charts/[^\s\n]+)'
-        mf_chart_pattern = r'📊 MUTUAL FUND CHART: (assets/charts/[^\s\n]+)'
+        logger.debug("Response first 200 chars: %s", response[:200])
         
-        stock_chart_match = re.search(stock_chart_pattern, response)
-        mf_chart_match = re.search(mf_chart_pattern, response)
+        # Most responses carry no chart, so only run the regexes when a marker is present
+        if 'CHART:' in response:
+            stock_chart_match = STOCK_CHART_RE.search(response)
+            mf_chart_match = None if stock_chart_match else MF_CHART_RE.search(response)
+        else:
+            stock_chart_match = mf_chart_match = None
         
         if stock_chart_match:
             chart_path = stock_chart_match.group(1)
-            logger.info(f"Found stock chart path: {chart_path}")
+            logger.info("Found stock chart path: %s", chart_path)
             # Remove the chart path line from the response
-            response = re.sub(r'📊 STOCK CHART: assets/charts/[^\n]+\n\n', '', response)
+            response = STOCK_CHART_STRIP_RE.sub('', response)
         elif mf_chart_match:
             chart_path = mf_chart_match.group(1)
-            logger.info(f"Found mutual fund chart path: {chart_path}")
+            logger.info("Found mutual fund chart path: %s", chart_path)
             # Remove the chart path line from the response
-            response = re.sub(r'📊 MUTUAL FUND CHART: assets/charts/[^\n]+\n\n', '', response)
+            response = MF_CHART_STRIP_RE.sub('', response)
         else:
             logger.info("No chart path found in response")
             
         # Check if the chart file actually exists
-        if chart_path and not os.path.exists(chart_path):
-            logger.error(f"Chart file not found: {chart_path}")
+        if chart_path and not chart_exists(chart_path):
+            logger.error("Chart file not found: %s", chart_path)
             # Set to None if file doesn't exist
             chart_path = None
             
@@ -112,7 +144,7 @@ def friday_endpoint():
         })
         
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}", exc_info=True)
+        logger.error("Error processing request: %s", e, exc_info=True)
         return jsonify({
             'error': 'An error occurred while processing your request',
             'details': str(e)
@@ -132,33 +164,26 @@ def static_files(path):
 @app.route('/assets/charts/<path:filename>')
 def serve_chart(filename):
     """Serve chart images from the assets/charts directory"""
-    logger.info(f"Serving chart: {filename}")
+    logger.info("Serving chart: %s", filename)
     
     try:
         # Use correct absolute path instead of relative path
         chart_path = os.path.join(charts_dir, filename)
         
         # Check if file exists
-        if not os.path.exists(chart_path):
-            logger.error(f"Chart file not found: {chart_path}")
+        if not chart_exists(chart_path):
+            logger.error("Chart file not found: %s", chart_path)
             return jsonify({
                 'error': 'Chart not found'
             }), 404
             
-        # Get the directory and filename separately for send_from_directory
-        directory = os.path.dirname(chart_path)
-        file = os.path.basename(chart_path)
-        
-        # Set caching headers for better performance
-        response = send_from_directory(directory, file)
-        
         # Cache for 1 hour, but allow revalidation
-        response.headers['Cache-Control'] = 'public, max-age=3600'
+        response = send_from_directory(charts_dir, filename, max_age=3600)
         response.headers['X-Content-Type-Options'] = 'nosniff'
         
         return response
     except Exception as e:
-        logger.error(f"Error serving chart: {str(e)}", exc_info=True)
+        logger.error("Error serving chart: %s", e, exc_info=True)
         return jsonify({
             'error': 'Error serving chart',
             'details': str(e)
@@ -168,11 +193,14 @@ if __name__ == '__main__':
     try:
         # Configure and start the server
         port = int(os.environ.get('PORT', 5000))
-        logger.info(f"Starting FRIDAY server on port {port}")
+        logger.info("Starting FRIDAY server on port %s", port)
         
-        # Run the Flask app
-        app.run(host='0.0.0.0', port=port, debug=True)
+        # Serve through waitress so concurrent chat requests get their own worker
+        # threads; process_command calls are long-running, so oversize the pool
+        from waitress import serve
+        logger.info("Using %s worker threads", SERVER_THREADS)
+        serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
         
     except Exception as e:
-        logger.error(f"Error starting server: {str(e)}", exc_info=True)
+        logger.error("Error starting server: %s", e, exc_info=True)
         sys.exit(1) 
\ No newline at end of file
@@ -10,6 +10,7 @@ import os
 import time
 import logging
 import random
+import re
 
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
@@ -26,6 +27,9 @@ logging.basicConfig(
 
 logger = logging.getLogger('friday_test_server')
 
+# Simulated processing delay is opt-in so load tests don't tie up worker threads
+SIMULATE_LATENCY = os.environ.get('FRIDAY_TEST_LATENCY') == '1'
+
 # Initialize Flask app
 app = Flask(__name__, static_folder='../frontend')
 CORS(app)  # Enable CORS for all routes
@@ -55,6 +59,13 @@ SPECIAL_RESPONSES = {
     "help": "I'm here to assist you. You can ask me questions, request information, or just chat. What would you like to know?"
 }
 
+# Lowercased keys for lookup, and one alternation (longest keys first) to find them in a single scan
+SPECIAL_RESPONSES_LC = {key.lower(): response for key, response in SPECIAL_RESPONSES.items()}
+SPECIAL_RE = re.compile(
+    '|'.join(re.escape(key) for key in sorted(SPECIAL_RESPONSES, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
 @app.route('/api/friday', methods=['POST'])
 def friday_endpoint():
     """Handle API requests to FRIDAY"""
@@ -65,32 +76,35 @@ def friday_endpoint():
             return jsonify({'error': 'No message provided'}), 400
             
         user_message = data['message']
-        logger.info(f"Received message: {user_message}")
+        logger.info("Received message: %s", user_message)
+        
+        start_time = time.perf_counter()
         
         # Add a small delay to simulate processing
-        time.sleep(random.uniform(0.5, 2.0))
+        if SIMULATE_LATENCY:
+            time.sleep(random.uniform(0.5, 2.0))
         
         # Check for special responses
-        for key, response in SPECIAL_RESPONSES.items():
-            if key in user_message.lower():
-                return jsonify({
-                    'response': response,
-                    'processing_time': random.uniform(0.5, 2.0)
-                })
+        special_match = SPECIAL_RE.search(user_message)
+        if special_match:
+            return jsonify({
+                'response': SPECIAL_RESPONSES_LC[special_match.group(0).lower()],
+                'processing_time': time.perf_counter() - start_time
+            })
         
         # For other messages, return a random response
         response = random.choice(FRIDAY_RESPONSES)
         
-        logger.info(f"Response: {response}")
+        logger.info("Response: %s", response)
         
         # Return the response as JSON
         return jsonify({
             'response': response,
-            'processing_time': random.uniform(0.5, 2.0)
+            'processing_time': time.perf_counter() - start_time
         })
         
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}", exc_info=True)
+        logger.error("Error processing request: %s", e, exc_info=True)
         return jsonify({
             'error': 'An error occurred while processing your request',
             'details': str(e)
@@ -110,7 +124,7 @@ if __name__ == '__main__':
     try:
         # Configure and start the server
         port = int(os.environ.get('PORT', 5000))
-        logger.info(f"Starting FRIDAY TEST server on port {port}")
+        logger.info("Starting FRIDAY TEST server on port %s", port)
         
         print(f"""
 =========================================================
@@ -128,5 +142,5 @@ Press Ctrl+C to stop the server.
         app.run(host='0.0.0.0', port=port, debug=True)
         
     except Exception as e:
-        logger.error(f"Error starting server: {str(e)}", exc_info=True)
+        logger.error("Error starting server: %s", e, exc_info=True)
         print(f"Error: {str(e)}") 
\ No newline at end of file